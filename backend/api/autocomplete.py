@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Query
+
+from schema.autocomplete import AutocompleteSuggestion
+from utils.autocomplete import autocomplete_index
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[AutocompleteSuggestion])
+def autocomplete(
+    q: str = Query(..., min_length=1),
+    kinds: str | None = Query(
+        None, description="Comma-separated: college, location, degree, ..."
+    ),
+    limit: int = Query(10, ge=1, le=50),
+):
+    selected = {kind.strip() for kind in kinds.split(",")} if kinds else None
+    return [
+        AutocompleteSuggestion(kind=entry.kind, label=entry.label, id=entry.ref_id)
+        for entry in autocomplete_index.lookup(q, selected, limit)
+    ]
@@ -1,22 +1,66 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Response
 
 import crud.career as crud_career
-from db.deps import get_db
-from schema.career import CareerBase
+from api.conditional import conditional
+from api.export import export_response
+from api.pagination import (
+    RowsJSONResponse,
+    include_query,
+    page_query,
+    page_response,
+)
+from core.config import settings
+from crud.pagination import PageQuery
+from db.deps import get_session
+from db.query_budget import query_budget
+from db.session import AnySession, run_db
+from models.career import Career
+from schema.career import CareerBase, CareerResponse
 
 router = APIRouter()
+conditional_get = Depends(
+    conditional(
+        "careers",
+        "courses",
+        "career_courses",
+        cache_control=settings.catalog_cache_control,
+    )
+)
 
 
 @router.post("/", response_model=CareerBase)
-def create_career(career: CareerBase, db: Session = Depends(get_db)):
-    return crud_career.create_career(db=db, career=career)
+async def create_career(career: CareerBase, db: AnySession = Depends(get_session)):
+    return await run_db(db, crud_career.create_career, career=career)
 
 
-@router.get("/", response_model=list[CareerBase])
-def get_all_careers(db: Session = Depends(get_db)):
-    return crud_career.get_all_careers(db=db)
+@router.get(
+    "/",
+    response_model=list[CareerResponse],
+    response_model_exclude_unset=True,
+    dependencies=[conditional_get, Depends(query_budget(3))],
+)
+async def get_all_careers(
+    response: Response,
+    page: PageQuery = Depends(page_query(CareerBase)),
+    include: tuple[str, ...] = Depends(include_query(Career)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response,
+        await run_db(db, crud_career.get_all_careers, page, include),
+        RowsJSONResponse,
+    )
 
 
-def get_career_by_id(career_id: int, db: Session = Depends(get_db)):
-    return crud_career.get_career_by_id(db=db, career_id=career_id)
+@router.get("/export")
+async def export_careers(gzip: bool = False):
+    return export_response(Career, CareerBase, gzip=gzip)
+
+
+@router.get(
+    "/{career_id}",
+    response_model=CareerResponse,
+    dependencies=[conditional_get, Depends(query_budget(1))],
+)
+async def get_career_by_id(career_id: int, db: AnySession = Depends(get_session)):
+    return await run_db(db, crud_career.get_career_by_id, career_id=career_id)
@@ -1,35 +1,131 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 import crud.college as crud_college
-from db.deps import get_db
-from schema.college import CollegeCreate, CollegeOut
+import crud.student as crud_student
+from api.conditional import conditional
+from api.export import export_response
+from api.ingest import ingest_response
+from api.pagination import page_query, page_response
+from core.config import settings
+from crud.pagination import PageQuery
+from db.deps import get_session
+from db.session import AnySession, run_db
+from models.college import College
+from schema.college import CollegeCreate, CollegeMatch, CollegeNearby, CollegeOut
+from utils.geo import geo_index, geocode
 
 router = APIRouter()
+conditional_get = Depends(
+    conditional("colleges", cache_control=settings.catalog_cache_control)
+)
 
 
 @router.post("/bulk/", response_model=list[CollegeOut], status_code=201)
-def create_college_bulk(colleges: list[CollegeCreate], db: Session = Depends(get_db)):
-    return crud_college.create_college_bulk(db, colleges)
+async def create_college_bulk(
+    colleges: list[CollegeCreate],
+    response: Response,
+    db: AnySession = Depends(get_session),
+):
+    return ingest_response(
+        response, await run_db(db, crud_college.create_college_bulk, colleges)
+    )
 
 
 @router.post("/", response_model=CollegeOut, status_code=201)
-def create_college(college: CollegeCreate, db: Session = Depends(get_db)):
-    return crud_college.create_college(db, college)
+async def create_college(college: CollegeCreate, db: AnySession = Depends(get_session)):
+    return await run_db(db, crud_college.create_college, college)
+
+
+@router.get("/", response_model=list[CollegeOut], dependencies=[conditional_get])
+async def get_all_colleges(
+    response: Response,
+    page: PageQuery = Depends(page_query(CollegeOut)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response, await run_db(db, crud_college.get_all_colleges, page)
+    )
+
+
+@router.get("/export")
+async def export_colleges(gzip: bool = False):
+    return export_response(College, CollegeOut, gzip=gzip)
 
 
-@router.get("/", response_model=list[CollegeOut])
-def get_all_colleges(db: Session = Depends(get_db)):
-    return crud_college.get_all_colleges(db)
+@router.get(
+    "/match/", response_model=list[CollegeMatch], dependencies=[conditional_get]
+)
+async def match_colleges(
+    stream: str,
+    score: float,
+    degree: str | None = None,
+    state: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=settings.max_page_size),
+    db: AnySession = Depends(get_session),
+):
+    return await run_db(
+        db, crud_college.match_colleges, stream, score, degree, state, limit
+    )
+
+
+@router.get("/near/", response_model=list[CollegeNearby])
+async def near_colleges(
+    city: str | None = None,
+    state: str | None = None,
+    student_id: int | None = None,
+    lat: float | None = Query(default=None, ge=-90, le=90),
+    lon: float | None = Query(default=None, ge=-180, le=180),
+    radius_km: float | None = Query(default=None, gt=0),
+    limit: int | None = Query(default=None, ge=1, le=settings.max_page_size),
+    db: AnySession = Depends(get_session),
+):
+    if lat is not None and lon is not None:
+        origin = (lat, lon)
+    else:
+        if city is None and student_id is not None:
+            student = await run_db(db, crud_student.get_student_by_id, student_id)
+            if not student:
+                raise HTTPException(status_code=404, detail="Student not found")
+            city = student.city
+        if not city:
+            raise HTTPException(
+                status_code=400, detail="Provide lat/lon, city or student_id"
+            )
+        origin = geocode(city, state=state)
+        if origin is None:
+            raise HTTPException(status_code=404, detail="Location not found")
+
+    hits = geo_index.nearest(origin, limit or settings.search_default_limit, radius_km)
+    colleges = await run_db(
+        db, crud_college.get_colleges_by_ids, [college_id for college_id, _ in hits]
+    )
+    distances = dict(hits)
+    return [
+        {"college": college, "distance_km": round(distances[college.college_id], 2)}
+        for college in colleges
+    ]
 
 
-@router.get("/search/", response_model=list[CollegeOut])
-def search_college(name: str, db: Session = Depends(get_db)):
-    return crud_college.search_college(db, name)
+@router.get("/search/", response_model=list[CollegeOut], dependencies=[conditional_get])
+async def search_college(
+    name: str,
+    response: Response,
+    page: PageQuery = Depends(page_query(CollegeOut, ranked=True)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response, await run_db(db, crud_college.search_college, name, page)
+    )
 
 
-@router.get("/filter/", response_model=list[CollegeOut])
-def filter_college(
-    city: str | None = None, state: str | None = None, db: Session = Depends(get_db)
+@router.get("/filter/", response_model=list[CollegeOut], dependencies=[conditional_get])
+async def filter_college(
+    response: Response,
+    city: str | None = None,
+    state: str | None = None,
+    page: PageQuery = Depends(page_query(CollegeOut)),
+    db: AnySession = Depends(get_session),
 ):
-    return crud_college.filter_college(db, city, state)
+    return page_response(
+        response, await run_db(db, crud_college.filter_college, city, state, page)
+    )
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from crud.cache import table_states
+from db.deps import get_session
+from db.query_budget import uncounted
+from db.session import AnySession, run_db
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110) is the one defined for If-None-Match.
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def not_modified(headers: dict) -> HTTPException:
+    # Starlette sends 304s raised this way without a body.
+    return HTTPException(status_code=304, headers=headers)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _modified_since(request: Request, last_modified: datetime | None) -> bool:
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return True
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return True
+    return last_modified.replace(microsecond=0) > _utc(since)
+
+
+def conditional(*tables: str, cache_control: str):
+    async def dependency(
+        request: Request, response: Response, db: AnySession = Depends(get_session)
+    ) -> None:
+        with uncounted():
+            states = await run_db(db, table_states, tables)
+        # The body is a function of the route, its query and the table
+        # states, so hashing those gives a strong validator without loading
+        # a single row.
+        fingerprint = json.dumps(
+            [
+                request.url.path,
+                sorted(request.query_params.multi_items()),
+                states,
+            ],
+            default=str,
+        )
+        etag = f'"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+
+        updated = [_utc(s["updated_at"]) for s in states if s.get("updated_at")]
+        last_modified = max(updated) if updated else None
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if etag_matches(if_none_match, etag) or (
+            if_none_match is None and not _modified_since(request, last_modified)
+        ):
+            raise not_modified(headers)
+        response.headers.update(headers)
+
+    return dependency
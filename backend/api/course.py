@@ -1,23 +1,52 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Response
 
 import crud.course as crud_course
-from db.deps import get_db
+from api.conditional import conditional
+from api.export import export_response
+from api.pagination import RowsJSONResponse, page_query, page_response
+from core.config import settings
+from crud.pagination import PageQuery
+from db.deps import get_session
+from db.query_budget import query_budget
+from db.session import AnySession, run_db
+from models.course import Course
 from schema.course import CourseBase, CourseResponse
 
 router = APIRouter()
+conditional_get = Depends(
+    conditional("courses", cache_control=settings.catalog_cache_control)
+)
 
 
 @router.post("/", response_model=CourseResponse)
-def create_course(course: CourseBase, db: Session = Depends(get_db)):
-    return crud_course.create_course(db, course)
-
-
-@router.get("/", response_model=list[CourseResponse])
-def get_all_courses(db: Session = Depends(get_db)):
-    return crud_course.get_all_courses(db)
-
-
-@router.get("/{course_id}", response_model=CourseResponse)
-def get_course_by_id(course_id: int, db: Session = Depends(get_db)):
-    return crud_course.get_course_by_id(db, course_id)
+async def create_course(course: CourseBase, db: AnySession = Depends(get_session)):
+    return await run_db(db, crud_course.create_course, course)
+
+
+@router.get(
+    "/",
+    response_model=list[CourseResponse],
+    dependencies=[conditional_get, Depends(query_budget(2))],
+)
+async def get_all_courses(
+    response: Response,
+    page: PageQuery = Depends(page_query(CourseResponse)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response,
+        await run_db(db, crud_course.get_all_courses, page),
+        RowsJSONResponse,
+    )
+
+
+@router.get("/export")
+async def export_courses(gzip: bool = False):
+    return export_response(Course, CourseResponse, gzip=gzip)
+
+
+@router.get(
+    "/{course_id}", response_model=CourseResponse, dependencies=[conditional_get]
+)
+async def get_course_by_id(course_id: int, db: AnySession = Depends(get_session)):
+    return await run_db(db, crud_course.get_course_by_id, course_id)
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
+from api.conditional import etag_matches
+from core.config import settings
+from crud.hooks import notify_write
 from db.deps import get_db
-from mock_data import roadmaps
 from models.career import Career
 from models.course import Course
+from schema.course_career import GraphNode, GraphPath
+from utils.course_graph import NODE_KINDS, course_graph
+from utils.roadmaps import roadmap_registry
 
 router = APIRouter()
 
@@ -19,18 +26,86 @@ def map_course_to_career(
         career.courses.append(course)
         db.commit()
         db.refresh(career)
+        notify_write(
+            "career_courses",
+            [{"career_id": career.career_id, "course_id": course.course_id}],
+        )
         return career
 
 
 @router.get("/roadmaps/{career_field}", response_model=dict)
-def get_roadmap_by_field(career_field: str):
-    normalized_field = career_field.strip().lower()
-    print(normalized_field)
-    for r in roadmaps:
-        roadmap_field = r.get("careerField", "").strip().lower()
-        if roadmap_field == normalized_field:
-            return r
-
-    raise HTTPException(
-        status_code=404, detail=f"No roadmap found for '{career_field}'"
-    )
+def get_roadmap_by_field(career_field: str, request: Request):
+    match = roadmap_registry.payload(career_field)
+    if match is None:
+        raise HTTPException(
+            status_code=404, detail=f"No roadmap found for '{career_field}'"
+        )
+    field, payload, etag = match
+    headers = {
+        "X-Career-Field": field,
+        "ETag": etag,
+        "Cache-Control": settings.roadmap_cache_control,
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _graph_nodes(graph, ranked) -> list[dict]:
+    return [
+        {"kind": graph.nodes[node][0], "label": graph.nodes[node][1], "depth": depth}
+        for depth, node in ranked
+    ]
+
+
+@router.get("/graph/path", response_model=GraphPath)
+def get_career_path(stream: str, career: str):
+    def compute(graph):
+        goal = graph.find("career", career)
+        starts = graph.find_prefix("stream", stream)
+        path = graph.shortest_path(starts, goal) if goal is not None else None
+        if not path:
+            return {"length": -1, "nodes": []}
+        return {
+            "length": len(path) - 1,
+            "nodes": _graph_nodes(graph, enumerate(path)),
+        }
+
+    result = course_graph.query("path", (stream, career), compute)
+    if not result["nodes"]:
+        raise HTTPException(
+            status_code=404, detail=f"No path from '{stream}' to '{career}'"
+        )
+    return result
+
+
+@router.get("/graph/reachable", response_model=list[GraphNode])
+def get_reachable_careers(course: str):
+    def compute(graph):
+        start = graph.find("course", course)
+        if start is None:
+            return None
+        return _graph_nodes(graph, graph.reachable(start, "career"))
+
+    result = course_graph.query("reachable", (course,), compute)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Unknown course '{course}'")
+    return result
+
+
+@router.get("/graph/neighbourhood", response_model=list[GraphNode])
+def get_neighbourhood(
+    kind: Literal[NODE_KINDS],
+    label: str,
+    hops: int = Query(1, ge=1, le=settings.graph_max_hops),
+):
+    def compute(graph):
+        start = graph.find(kind, label)
+        if start is None:
+            return None
+        return _graph_nodes(graph, graph.neighbourhood(start, hops))
+
+    result = course_graph.query("neighbourhood", (kind, label, hops), compute)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Unknown {kind} '{label}'")
+    return result
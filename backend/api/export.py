@@ -0,0 +1,67 @@
+import zlib
+from typing import AsyncIterator, Iterator
+
+from fastapi.concurrency import iterate_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import select
+
+from core.config import settings
+from db.async_database import AsyncSessionLocal
+from db.database import SessionLocal
+
+
+def _statement(model):
+    # Plain column rows skip the ORM identity map and unit of work entirely.
+    return (
+        select(*model.__table__.columns)
+        .order_by(*model.__mapper__.primary_key)
+        .execution_options(yield_per=settings.export_chunk_size)
+    )
+
+
+def _encode(adapter: TypeAdapter, rows) -> bytes:
+    return b"".join(
+        adapter.dump_json(adapter.validate_python(row, from_attributes=True)) + b"\n"
+        for row in rows
+    )
+
+
+def _sync_chunks(model, adapter: TypeAdapter) -> Iterator[bytes]:
+    with SessionLocal() as db:
+        for rows in db.execute(_statement(model)).partitions():
+            yield _encode(adapter, rows)
+
+
+async def _async_chunks(model, adapter: TypeAdapter) -> AsyncIterator[bytes]:
+    assert AsyncSessionLocal is not None
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(_statement(model))
+        async for rows in result.partitions():
+            yield _encode(adapter, rows)
+
+
+async def _gzipped(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_response(model, schema: type[BaseModel], gzip: bool = False):
+    adapter = TypeAdapter(schema)
+    # The export opens its own session: the request-scoped one is closed before
+    # the response body has finished streaming.
+    if AsyncSessionLocal is not None:
+        chunks = _async_chunks(model, adapter)
+    else:
+        chunks = iterate_in_threadpool(_sync_chunks(model, adapter))
+
+    filename = f"{model.__tablename__}.ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        chunks = _gzipped(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
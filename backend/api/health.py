@@ -0,0 +1,42 @@
+import logging
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from crud.cache import cache_stats
+from db.async_database import async_engine
+from db.database import engine, pool_status
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/db")
+def db_health():
+    start = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception:
+        # Driver errors can carry the DSN or host; keep them in the logs only.
+        logger.exception("database health check failed")
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "pool": pool_status(engine)},
+        )
+    status = {
+        "status": "ok",
+        "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        "pool": pool_status(engine),
+    }
+    if async_engine is not None:
+        status["async_pool"] = pool_status(async_engine.sync_engine)
+    return status
+
+
+@router.get("/cache")
+def catalog_cache_health():
+    return cache_stats()
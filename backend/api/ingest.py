@@ -0,0 +1,16 @@
+from fastapi import HTTPException, Response
+
+from crud.ingest import IngestReport
+
+
+def ingest_response(response: Response, report: IngestReport) -> list:
+    if report.failed_batches and not report.rows:
+        raise HTTPException(status_code=500, detail=report.errors)
+    response.headers.update(
+        {
+            "X-Ingest-Inserted": str(report.inserted),
+            "X-Ingest-Updated": str(report.updated),
+            "X-Ingest-Failed-Batches": str(report.failed_batches),
+        }
+    )
+    return report.rows
@@ -0,0 +1,92 @@
+from typing import Callable
+
+from fastapi import HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from core.config import settings
+from crud.loading import RELATIONSHIPS
+from crud.pagination import Page, PageQuery
+
+
+class RowsJSONResponse(JSONResponse):
+    # pydantic-core encodes plain row dicts in one pass, without
+    # jsonable_encoder or a response_model round trip. For str/int/bool/list
+    # values the bytes match JSONResponse's compact UTF-8 output.
+    def render(self, content) -> bytes:
+        return to_json(content)
+
+
+def page_query(
+    schema: type[BaseModel], ranked: bool = False
+) -> Callable[..., PageQuery]:
+    allowed = set(schema.model_fields)
+
+    def dependency(
+        after: int | None = Query(None, description="Return rows after this id"),
+        limit: int | None = Query(
+            settings.default_page_size, ge=1, le=settings.max_page_size
+        ),
+        fields: str | None = Query(None, description="Comma-separated columns"),
+        include_total: bool = False,
+    ) -> PageQuery:
+        if ranked and (after is not None or include_total):
+            # Ranked results are ordered by relevance, not id, so an id cursor
+            # or a total over the whole table would be meaningless.
+            raise HTTPException(
+                status_code=400,
+                detail="Ranked search does not support after or include_total",
+            )
+        selected = None
+        if fields:
+            selected = tuple(dict.fromkeys(f.strip() for f in fields.split(",")))
+            unknown = [field for field in selected if field not in allowed]
+            if unknown:
+                raise HTTPException(
+                    status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+                )
+        return PageQuery(after, limit, selected, include_total)
+
+    return dependency
+
+
+def include_query(model) -> Callable[..., tuple[str, ...]]:
+    allowed = RELATIONSHIPS.get(model, ())
+
+    def dependency(
+        include: str | None = Query(
+            None, description=f"Comma-separated: {', '.join(allowed)}"
+        ),
+    ) -> tuple[str, ...]:
+        if not include:
+            return ()
+        selected = tuple(dict.fromkeys(i.strip() for i in include.split(",")))
+        unknown = [name for name in selected if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown include: {', '.join(unknown)}"
+            )
+        return selected
+
+    return dependency
+
+
+def page_response(
+    response: Response, page: Page, response_class: type[JSONResponse] = JSONResponse
+):
+    headers = {}
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = str(page.next_cursor)
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+
+    # Plain-row pages (projections and fast paths) bypass the response_model.
+    if page.projected:
+        content = page.items
+        if response_class is JSONResponse:
+            content = jsonable_encoder(content)
+        return response_class(content=content, headers={**response.headers, **headers})
+    response.headers.update(headers)
+    return page.items
@@ -1,15 +1,139 @@
-from fastapi import APIRouter
+import asyncio
+import json
 
-from schema.recommendation import RecommendationRequest, RecommendationResult
-from utils.gemini import generate_career_explanation
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from db import jobs
+from db.deps import get_db
+from schema.recommendation import (
+    BulkExplanationPage,
+    BulkRecommendationResult,
+    RecommendationRequest,
+    RecommendationResult,
+)
+from utils.bulk_jobs import (
+    BULK_EXPLANATIONS,
+    bulk_job_payload,
+    bulk_jobs,
+    queued_bulk_page,
+    start_bulk_job,
+)
+from utils.cancellation import cancel_on_disconnect
+from utils.explanation_cache import explanation_cache
+from utils.gemini import (
+    explanation_flights,
+    generate_career_explanation,
+    recommend_stream,
+    stream_career_explanation,
+    warm_explanation_cache,
+)
+from utils.scoring_engine import recommend_streams
 
 router = APIRouter()
 
 
 @router.post("/recommendation", response_model=RecommendationResult, status_code=200)
-async def get_recommendation(payload: RecommendationRequest):
-    recommended_stream, explanation = generate_career_explanation(payload.answers)
+async def get_recommendation(payload: RecommendationRequest, request: Request):
+    try:
+        recommended_stream, explanation = await cancel_on_disconnect(
+            request, generate_career_explanation(payload.answers)
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="AI explanation timed out")
     return RecommendationResult(
         recommended_stream=recommended_stream,
         ai_reasoning=explanation,
     )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/recommendation/stream")
+async def stream_recommendation(payload: RecommendationRequest):
+    recommended_stream = recommend_stream(payload.answers)
+
+    async def events():
+        yield _sse("stream", {"recommended_stream": recommended_stream})
+        try:
+            async for text in stream_career_explanation(
+                payload.answers, recommended_stream
+            ):
+                yield _sse("chunk", {"text": text})
+        except asyncio.TimeoutError:
+            yield _sse("error", {"detail": "AI explanation timed out"})
+            return
+        yield _sse("done", {})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/recommendation/bulk", response_model=BulkRecommendationResult, status_code=202
+)
+async def create_bulk_recommendation(
+    payloads: list[RecommendationRequest], db: Session = Depends(get_db)
+):
+    if len(payloads) > settings.bulk_max_sheets:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.bulk_max_sheets} answer sheets per request",
+        )
+    answer_sheets = [payload.answers for payload in payloads]
+    recommended_streams = await run_in_threadpool(recommend_streams, answer_sheets)
+    if settings.bulk_job_backend == "queue":
+        job = await run_in_threadpool(
+            jobs.enqueue,
+            db,
+            BULK_EXPLANATIONS,
+            bulk_job_payload(answer_sheets, recommended_streams),
+        )
+        job_id = str(job.job_id)
+    else:
+        job_id = start_bulk_job(answer_sheets, recommended_streams).job_id
+    return BulkRecommendationResult(
+        job_id=job_id, recommended_streams=recommended_streams
+    )
+
+
+@router.get("/recommendation/bulk/{job_id}", response_model=BulkExplanationPage)
+def get_bulk_recommendation(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    if settings.bulk_job_backend == "queue":
+        job = jobs.get_job(db, int(job_id)) if job_id.isdigit() else None
+        if job is None or job.kind != BULK_EXPLANATIONS:
+            raise HTTPException(status_code=404, detail="Bulk job not found")
+        return queued_bulk_page(job, offset, limit)
+
+    bulk_job = bulk_jobs.get(job_id)
+    if bulk_job is None:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    return bulk_job.page(offset, limit)
+
+
+@router.get("/recommendation/cache/stats", response_model=dict)
+def get_explanation_cache_stats():
+    return {
+        **explanation_cache.stats(),
+        "in_flight": len(explanation_flights),
+        "coalesced": explanation_flights.shared,
+    }
+
+
+@router.post("/recommendation/cache/warm", response_model=dict)
+async def warm_recommendation_cache(payloads: list[RecommendationRequest]):
+    warmed = await warm_explanation_cache([payload.answers for payload in payloads])
+    return {"warmed": warmed}
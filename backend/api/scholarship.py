@@ -1,40 +1,100 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Response
 
 import crud.scholarship as crud_scholarship
-from db.deps import get_db
+from api.conditional import conditional
+from api.export import export_response
+from api.ingest import ingest_response
+from api.pagination import page_query, page_response
+from core.config import settings
+from crud.pagination import PageQuery
+from db.deps import get_session
+from db.session import AnySession, run_db
+from models.scholarship import Scholarship
 from schema.scholarship import ScholarshipCreate, ScholarshipOut
 
 router = APIRouter()
+conditional_get = Depends(
+    conditional("scholarships", cache_control=settings.catalog_cache_control)
+)
 
 
 @router.post("/bulk", response_model=list[ScholarshipOut])
-def create_scholarship_bulk(
-    scholarships: list[ScholarshipCreate], db: Session = Depends(get_db)
+async def create_scholarship_bulk(
+    scholarships: list[ScholarshipCreate],
+    response: Response,
+    db: AnySession = Depends(get_session),
 ):
-    return crud_scholarship.create_scholarship_bulk(db, scholarships)
+    return ingest_response(
+        response,
+        await run_db(db, crud_scholarship.create_scholarship_bulk, scholarships),
+    )
 
 
 @router.post("/", response_model=ScholarshipOut)
-def create_scholarship(scholarship: ScholarshipCreate, db: Session = Depends(get_db)):
-    return crud_scholarship.create_scholarship(db, scholarship)
+async def create_scholarship(
+    scholarship: ScholarshipCreate, db: AnySession = Depends(get_session)
+):
+    return await run_db(db, crud_scholarship.create_scholarship, scholarship)
+
+
+@router.get("/", response_model=list[ScholarshipOut], dependencies=[conditional_get])
+async def get_all_scholarships(
+    response: Response,
+    page: PageQuery = Depends(page_query(ScholarshipOut)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response, await run_db(db, crud_scholarship.get_all_scholarships, page)
+    )
 
 
-@router.get("/", response_model=list[ScholarshipOut])
-def get_all_scholarships(db: Session = Depends(get_db)):
-    return crud_scholarship.get_all_scholarships(db)
+@router.get("/export")
+async def export_scholarships(gzip: bool = False):
+    return export_response(Scholarship, ScholarshipOut, gzip=gzip)
 
 
-@router.get("/search/", response_model=list[ScholarshipOut])
-def search_scholarship(name: str, db: Session = Depends(get_db)):
-    return crud_scholarship.search_scholarship(db, name)
+@router.get(
+    "/search/", response_model=list[ScholarshipOut], dependencies=[conditional_get]
+)
+async def search_scholarship(
+    name: str,
+    response: Response,
+    page: PageQuery = Depends(page_query(ScholarshipOut, ranked=True)),
+    db: AnySession = Depends(get_session),
+):
+    return page_response(
+        response, await run_db(db, crud_scholarship.search_scholarship, name, page)
+    )
 
 
-@router.get("/filter/", response_model=list[ScholarshipOut])
-def filter_scholarship(
-    eligibility: str | None = None,
-    start_after: str | None = None,
-    end_before: str | None = None,
-    db: Session = Depends(get_db),
+@router.get(
+    "/filter/", response_model=list[ScholarshipOut], dependencies=[conditional_get]
+)
+async def filter_scholarship(
+    response: Response,
+    eligibility: list[str] | None = Query(None),
+    start_after: date | None = None,
+    end_before: date | None = None,
+    documents: list[str] | None = Query(None),
+    match: Literal["all", "any"] = "all",
+    active_on: date | None = None,
+    page: PageQuery = Depends(page_query(ScholarshipOut)),
+    db: AnySession = Depends(get_session),
 ):
-    return crud_scholarship.filter_scholarship(db, eligibility, start_after, end_before)
+    return page_response(
+        response,
+        await run_db(
+            db,
+            crud_scholarship.filter_scholarship,
+            eligibility,
+            start_after,
+            end_before,
+            page,
+            documents=documents,
+            match=match,
+            active_on=active_on,
+        ),
+    )
@@ -1,41 +1,49 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
 from crud import student as crud_student
-from db.deps import get_db
+from db.deps import get_session
+from db.session import AnySession, run_db
 from schema.student import StudentCreate, StudentLogin, StudentOut
-from utils.hashing import verify_password
+from utils.hashing import hash_password_async, verify_and_update_password_async
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=StudentOut, status_code=201)
-def create_student(student: StudentCreate, db: Session = Depends(get_db)):
-    existing = crud_student.get_student_by_email(db, email=student.email)
+async def create_student(student: StudentCreate, db: AnySession = Depends(get_session)):
+    existing = await run_db(db, crud_student.get_student_by_email, email=student.email)
     if existing:
         raise HTTPException(status_code=400, detail="Student already exists")
 
-    db_student = crud_student.create_student(db, student)
+    hashed_password = await hash_password_async(student.password)
+    db_student = await run_db(db, crud_student.create_student, student, hashed_password)
     return StudentOut.model_validate(db_student)
 
 
 @router.post("/login", response_model=StudentOut)
-def login_student(student: StudentLogin, db: Session = Depends(get_db)):
-    db_student = crud_student.get_student_by_email(db, email=student.email)
+async def login_student(student: StudentLogin, db: AnySession = Depends(get_session)):
+    db_student = await run_db(
+        db, crud_student.get_student_by_email, email=student.email
+    )
     if not db_student:
         raise HTTPException(status_code=404, detail="Student not found")
 
     raw_pw = getattr(db_student, "password", None)
 
-    if not verify_password(student.password, str(raw_pw)):
+    valid, new_hash = await verify_and_update_password_async(
+        student.password, str(raw_pw)
+    )
+    if not valid:
         raise HTTPException(status_code=400, detail="Invalid email or password")
+    if new_hash:
+        await run_db(db, crud_student.update_password, db_student, new_hash)
 
     return StudentOut.model_validate(db_student)
 
 
 @router.get("/me/{email}", response_model=StudentOut)
-def get_student(email: str, db: Session = Depends(get_db)):
-    db_student = crud_student.get_student_by_email(db, email=email)
+async def get_student(email: str, db: AnySession = Depends(get_session)):
+    db_student = await run_db(db, crud_student.get_student_by_email, email=email)
     if not db_student:
         raise HTTPException(status_code=404, detail="Student not found")
     return StudentOut.model_validate(db_student)
@@ -0,0 +1,156 @@
+import argparse
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import crud.career as crud_career
+import crud.course as crud_course
+from api.pagination import RowsJSONResponse
+from crud.loading import load_options
+from crud.pagination import PageQuery, paginate
+from db.database import Base
+from models.career import Career
+from models.career_course import career_courses
+from models.course import Course
+from schema.career import CareerResponse
+from schema.course import CourseResponse
+
+
+def seed(db: Session, rows: int) -> None:
+    db.execute(
+        insert(Course),
+        [
+            {
+                "course_name": f"Course {i} – B.Sc.",
+                "stream": ("Science", "Commerce", "Arts")[i % 3],
+                "description": f'Semester plan "{i}"\nयोजना',
+            }
+            for i in range(rows)
+        ],
+    )
+    db.execute(
+        insert(Career),
+        [
+            {
+                "career_name": f"Career {i}",
+                "sector": "Public",
+                "higher_study_options": ["M.Sc.", f"Ph.D. {i}"],
+                "exam_options": ["GATE", "NET"],
+            }
+            for i in range(rows)
+        ],
+    )
+    db.execute(
+        insert(career_courses),
+        [
+            {"career_id": i + 1, "course_id": (i + k) % rows + 1}
+            for i in range(rows)
+            for k in range(3)
+        ],
+    )
+    db.commit()
+
+
+# The previous path: ORM instances, model_validate per row, then FastAPI
+# validating and dumping the list again against the response_model.
+def orm_courses(db: Session, page: PageQuery):
+    rows = paginate(db, Course, page, options=load_options(Course)).items
+    return [CourseResponse.model_validate(course) for course in rows]
+
+
+def orm_careers(db: Session, page: PageQuery, include: tuple[str, ...]):
+    rows = paginate(db, Career, page, options=load_options(Career, include)).items
+    fields = [f for f in CareerResponse.model_fields if f != "courses" or include]
+    return [
+        CareerResponse.model_validate(
+            {field: getattr(career, field) for field in fields}, from_attributes=True
+        )
+        for career in rows
+    ]
+
+
+def before(db: Session, fetch, schema, exclude_unset: bool) -> bytes:
+    # Start each run from an empty identity map, as a fresh request would.
+    db.expunge_all()
+    field = create_model_field("Response", list[schema], mode="serialization")
+    content = asyncio.run(
+        serialize_response(
+            field=field, response_content=fetch(db), exclude_unset=exclude_unset
+        )
+    )
+    return JSONResponse(content).body
+
+
+def after(db: Session, fetch) -> bytes:
+    return RowsJSONResponse(fetch(db).items).body
+
+
+def timed(fn, repeat: int) -> tuple[float, bytes]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-row cost of the course/career list serialization paths."
+    )
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    page = PageQuery(limit=args.rows)
+    # __wrapped__ skips the read cache so every run does the full work.
+    cases = [
+        (
+            "courses",
+            lambda db: orm_courses(db, page),
+            CourseResponse,
+            False,
+            lambda db: crud_course.get_all_courses.__wrapped__(db, page),
+        ),
+        (
+            "careers",
+            lambda db: orm_careers(db, page, ()),
+            CareerResponse,
+            True,
+            lambda db: crud_career.get_all_careers.__wrapped__(db, page, ()),
+        ),
+        (
+            "careers?include=courses",
+            lambda db: orm_careers(db, page, ("courses",)),
+            CareerResponse,
+            True,
+            lambda db: crud_career.get_all_careers.__wrapped__(db, page, ("courses",)),
+        ),
+    ]
+    with Session(engine) as db:
+        seed(db, args.rows)
+        print(
+            f"{'endpoint':<26}{'before us/row':>14}{'after us/row':>14}{'speedup':>9}"
+        )
+        for name, old_fetch, schema, exclude_unset, new_fetch in cases:
+            old_time, old_body = timed(
+                lambda: before(db, old_fetch, schema, exclude_unset), args.repeat
+            )
+            new_time, new_body = timed(lambda: after(db, new_fetch), args.repeat)
+            assert old_body == new_body, f"{name}: response bytes differ"
+            print(
+                f"{name:<26}{old_time / args.rows * 1e6:>14.1f}"
+                f"{new_time / args.rows * 1e6:>14.1f}{old_time / new_time:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +8,80 @@ class Settings(BaseSettings):
     secret_key: str
     gemini_api_key: str
 
+    db_async: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 30 * 60
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 0
+    db_isolation_level: str | None = None
+    query_budget_enforce: bool = False
+    query_budget_default: int | None = 25
+
+    default_page_size: int | None = None
+    max_page_size: int = 1000
+    export_chunk_size: int = 1000
+
+    catalog_cache_enabled: bool = True
+    catalog_cache_size: int = 2048
+    catalog_cache_ttl_seconds: float = 5 * 60
+    # Per-process versions only see writes made by the same process; other
+    # workers serve stale reads (and ETags) for up to the TTL. Unset means
+    # shared whenever WEB_CONCURRENCY runs more than one worker.
+    catalog_cache_shared: bool | None = None
+    catalog_cache_version_refresh_seconds: float = 2.0
+    catalog_cache_control: str = "public, max-age=60"
+    web_concurrency: int = 1
+    roadmap_cache_control: str = "public, max-age=86400"
+    search_default_limit: int = 20
+    search_min_similarity: float = 0.3
+    search_candidate_factor: int = 5
+
+    autocomplete_max_entries: int = 500_000
+    autocomplete_scan_factor: int = 50
+    autocomplete_insort_limit: int = 64
+    roadmap_fuzzy_cutoff: float = 0.8
+    graph_cache_size: int = 1024
+    graph_cache_ttl_seconds: float = 60 * 60
+    graph_max_hops: int = 4
+    gazetteer_path: str = "data/gazetteer.csv"
+    geo_cell_degrees: float = 0.5
+
+    gemini_model: str = "gemini-2.5-flash"
+    gemini_max_concurrency: int = 8
+    gemini_timeout_seconds: float = 30.0
+
+    explanation_cache_size: int = 1024
+    explanation_cache_ttl_seconds: float = 7 * 24 * 60 * 60
+    explanation_cache_shared: bool = False
+
+    bulk_max_sheets: int = 10000
+    ingest_chunk_size: int = 1000
+    bulk_explanation_concurrency: int = 4
+    bulk_job_retention: int = 100
+    bulk_job_ttl_seconds: float = 24 * 60 * 60
+    bulk_job_backend: Literal["inline", "queue"] = "inline"
+    # Queued bulk jobs fail (and are retried) when at least this fraction of
+    # their prompts errored; below it the partial results are kept.
+    bulk_job_failure_ratio: float = 1.0
+
+    job_max_attempts: int = 3
+    job_retry_backoff_seconds: float = 5.0
+    job_lock_timeout_seconds: float = 10 * 60
+    job_poll_interval_seconds: float = 1.0
+    worker_concurrency: int = 4
+
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 64
+
+    @property
+    def catalog_cache_shared_versions(self) -> bool:
+        if self.catalog_cache_shared is None:
+            return self.web_concurrency > 1
+        return self.catalog_cache_shared
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import replace
+from functools import wraps
+from typing import Any, Callable
+
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud.hooks import on_write
+from crud.pagination import Page
+from db.database import Base, SessionLocal
+from models.table_version import TableVersion
+from utils.ttl_cache import TTLCache
+
+CACHED_TABLES = ("colleges", "scholarships", "courses", "careers", "career_courses")
+
+UPSERT_INSERTS = {"postgresql": postgres_insert, "sqlite": sqlite_insert}
+
+_MISSING = object()
+
+
+class SharedVersions:
+    # Versions kept in the database so every API process (and the catalog
+    # loader) sees the same counters; read at most once per refresh interval.
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._versions: dict[str, int] = {}
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def bump(self, table: str) -> None:
+        # Runs after the caller's write has committed, so it must not fail on
+        # a concurrent first bump of the same table.
+        with SessionLocal() as db:
+            make_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+            if make_insert is not None:
+                stmt = make_insert(TableVersion).values(table_name=table, version=1)
+                db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[TableVersion.table_name],
+                        set_={"version": TableVersion.version + 1},
+                    )
+                )
+                db.commit()
+            else:
+                self._bump_portable(db, table)
+        self._checked = 0.0
+
+    def _bump_portable(self, db: Session, table: str) -> None:
+        for _ in range(2):
+            updated = db.execute(
+                update(TableVersion)
+                .where(TableVersion.table_name == table)
+                .values(version=TableVersion.version + 1)
+            ).rowcount
+            if updated:
+                db.commit()
+                return
+            try:
+                db.add(TableVersion(table_name=table, version=1))
+                db.commit()
+                return
+            except IntegrityError:
+                # Another process inserted the row first; bump it instead.
+                db.rollback()
+
+    def get(self, table: str) -> int:
+        if time.monotonic() - self._checked > self.refresh_seconds:
+            with self._lock:
+                if time.monotonic() - self._checked > self.refresh_seconds:
+                    with SessionLocal() as db:
+                        rows = db.execute(
+                            select(TableVersion.table_name, TableVersion.version)
+                        ).all()
+                    self._versions = {name: version for name, version in rows}
+                    self._checked = time.monotonic()
+        return self._versions.get(table, 0)
+
+
+class TableVersions:
+    def __init__(self, shared: SharedVersions | None = None):
+        self.shared = shared
+        self._local: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def bump(self, table: str) -> None:
+        with self._lock:
+            self._local[table] += 1
+        if self.shared is not None:
+            self.shared.bump(table)
+
+    def get(self, table: str) -> tuple[int, int]:
+        shared = self.shared.get(table) if self.shared is not None else 0
+        return self._local[table], shared
+
+    def snapshot(self, tables: tuple[str, ...]) -> tuple:
+        return tuple(self.get(table) for table in tables)
+
+
+table_versions = TableVersions(
+    SharedVersions(settings.catalog_cache_version_refresh_seconds)
+    if settings.catalog_cache_shared_versions
+    else None
+)
+catalog_cache = TTLCache(
+    maxsize=settings.catalog_cache_size, ttl=settings.catalog_cache_ttl_seconds
+)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class CachedRow:
+    # Read-only snapshot of an ORM instance's loaded attributes. Cached values
+    # are shared across threads, so they must not carry session state or
+    # trigger lazy loads.
+    __slots__ = ("_values",)
+
+    def __init__(self, values: dict):
+        object.__setattr__(self, "_values", values)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("cached rows are read-only")
+
+    def __repr__(self) -> str:
+        return f"CachedRow({self._values!r})"
+
+
+def _snapshot(value: Any, seen: dict[int, CachedRow] | None = None) -> Any:
+    seen = {} if seen is None else seen
+    if isinstance(value, Page):
+        return replace(value, items=_snapshot(value.items, seen))
+    if isinstance(value, list):
+        return [_snapshot(item, seen) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(item, seen) for item in value)
+    if isinstance(value, dict):
+        return {key: _snapshot(item, seen) for key, item in value.items()}
+    if hasattr(value, "_sa_instance_state"):
+        # Loaded back-references point at rows already being copied.
+        if id(value) not in seen:
+            values: dict = {}
+            seen[id(value)] = CachedRow(values)
+            values.update(
+                (key, _snapshot(item, seen))
+                for key, item in inspect(value).dict.items()
+            )
+        return seen[id(value)]
+    return value
+
+
+def read_through(*tables: str):
+    # Cached results are keyed on the current version of every table the read
+    # depends on, so a write makes older entries unreachable immediately.
+    def decorate(fn: Callable):
+        @wraps(fn)
+        def wrapper(db, *args, **kwargs):
+            if not settings.catalog_cache_enabled:
+                return fn(db, *args, **kwargs)
+            key = (
+                fn.__module__,
+                fn.__qualname__,
+                table_versions.snapshot(tables),
+                _freeze(args),
+                _freeze(kwargs),
+            )
+            result = catalog_cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = _snapshot(fn(db, *args, **kwargs))
+                catalog_cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def _bump(table: str) -> Callable[[list], None]:
+    def listener(rows: list) -> None:
+        table_versions.bump(table)
+
+    return listener
+
+
+for _table in CACHED_TABLES:
+    on_write(_table)(_bump(_table))
+
+
+def _table_state(db: Session, table: str) -> dict:
+    model_table = Base.metadata.tables[table]
+    columns = [func.count().label("rows")]
+    if len(model_table.primary_key.columns) == 1:
+        columns.append(func.max(*model_table.primary_key.columns).label("last_id"))
+    if "updated_at" in model_table.c:
+        columns.append(func.max(model_table.c.updated_at).label("updated_at"))
+    return dict(db.execute(select(*columns).select_from(model_table)).one()._mapping)
+
+
+_table_state_readers = {
+    table: read_through(table)(_table_state) for table in CACHED_TABLES
+}
+
+
+def table_states(db: Session, tables: tuple[str, ...]) -> list[dict]:
+    # Row count, highest id and newest updated_at: cheap to compute, changes
+    # on every insert/upsert, and identical across API processes.
+    return [_table_state_readers[table](db, table) for table in tables]
+
+
+def cache_stats() -> dict:
+    return {
+        **catalog_cache.stats(),
+        "versions": {table: table_versions.get(table) for table in CACHED_TABLES},
+    }
@@ -1,8 +1,16 @@
 from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 import models.career as model_career
+from crud.cache import read_through
+from crud.hooks import notify_write
+from crud.loading import load_options
+from crud.pagination import Page, PageQuery, paginate, plain_rows
+from models.career_course import career_courses
+from models.course import Course
 from schema.career import CareerBase, CareerResponse
+from schema.course import CourseResponse
 
 
 def create_career(db: Session, career: CareerBase) -> CareerResponse:
@@ -10,18 +18,44 @@ def create_career(db: Session, career: CareerBase) -> CareerResponse:
     db.add(db_career)
     db.commit()
     db.refresh(db_career)
+    notify_write("careers", [db_career])
     return CareerResponse.model_validate(db_career)
 
 
-def get_all_careers(db: Session) -> list[CareerResponse]:
-    db_careers = db.query(model_career.Career).all()
-    return [CareerResponse.model_validate(career) for career in db_careers]
+def _attach_courses(db: Session, careers: list[dict]) -> None:
+    # One query for the whole page, like selectinload, but returning rows.
+    fields = tuple(CourseResponse.model_fields)
+    by_career = {}
+    for career in careers:
+        career["courses"] = by_career[career["career_id"]] = []
+    stmt = (
+        select(career_courses.c.career_id, *[getattr(Course, f) for f in fields])
+        .join(Course, Course.course_id == career_courses.c.course_id)
+        .where(career_courses.c.career_id.in_(list(by_career)))
+        .order_by(career_courses.c.career_id, Course.course_id)
+    )
+    for career_id, *values in db.execute(stmt):
+        by_career[career_id].append(dict(zip(fields, values)))
+
+
+@read_through("careers", "courses", "career_courses")
+def get_all_careers(
+    db: Session, page: PageQuery = PageQuery(), include: tuple[str, ...] = ()
+) -> Page:
+    result = paginate(
+        db, model_career.Career, plain_rows(page, CareerResponse, model_career.Career)
+    )
+    if "courses" in include and not page.fields and result.items:
+        _attach_courses(db, result.items)
+    return result
 
 
+@read_through("careers", "courses", "career_courses")
 def get_career_by_id(db: Session, career_id: int) -> CareerResponse:
     db_career = (
         db.query(model_career.Career)
-        .filter(model_career.Career.id == career_id)
+        .options(*load_options(model_career.Career, ("courses",), single=True))
+        .filter(model_career.Career.career_id == career_id)
         .first()
     )
     if not db_career:
@@ -1,42 +1,213 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from core.config import settings
+from crud.cache import read_through
+from crud.hooks import notify_write
+from crud.ingest import IngestReport, ingest
+from crud.pagination import Page, PageQuery, paginate
+from crud.search import ranked_search
 from models import college as models_college
+from models.college_degree import CollegeDegree
 from schema.college import CollegeCreate
+from utils.geo import geocode
 
 
-def create_college_bulk(db: Session, colleges: list[CollegeCreate]):
-    db_colleges = [
-        models_college.College(**college.model_dump()) for college in colleges
-    ]
-    db.add_all(db_colleges)
-    db.commit()
-    return db_colleges
+def _build_college(college: CollegeCreate) -> models_college.College:
+    data = college.model_dump()
+    db_college = models_college.College(**data)
+    db_college.degree_index = models_college.degree_rows(data["degrees"], data["state"])
+    db_college.geocode_attempted = True
+    point = geocode(data["location"], data["district"], state=data["state"])
+    if point:
+        db_college.latitude, db_college.longitude = point
+    return db_college
+
+
+def create_college_bulk(db: Session, colleges: list[CollegeCreate]) -> IngestReport:
+    return ingest(db, "colleges", colleges, collect_rows=True)
 
 
 def create_college(db: Session, college: CollegeCreate):
-    db_college = models_college.College(**college.model_dump())
+    db_college = _build_college(college)
     db.add(db_college)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"College '{college.college_name}' already exists in "
+            f"{college.district}; use the bulk endpoint to update it",
+        )
     db.refresh(db_college)
+    notify_write("colleges", [db_college])
     return db_college
 
 
-def get_all_colleges(db: Session):
-    return db.query(models_college.College).all()
+@read_through("colleges")
+def get_all_colleges(db: Session, page: PageQuery = PageQuery()) -> Page:
+    return paginate(db, models_college.College, page)
 
 
-def search_college(db: Session, name: str):
-    return (
-        db.query(models_college.College)
-        .filter(models_college.College.name.ilike(f"%{name}%"))
-        .all()
+@read_through("colleges")
+def search_college(db: Session, name: str, page: PageQuery = PageQuery()) -> Page:
+    return ranked_search(
+        db, models_college.College, models_college.College.college_name, name, page
     )
 
 
-def filter_college(db: Session, city: str | None = None, state: str | None = None):
-    query = db.query(models_college.College)
+@read_through("colleges")
+def filter_college(
+    db: Session,
+    city: str | None = None,
+    state: str | None = None,
+    page: PageQuery = PageQuery(),
+) -> Page:
+    criteria = []
     if city:
-        query = query.filter(models_college.College.location == city)
+        criteria.append(models_college.College.location == city)
+    if state:
+        criteria.append(models_college.College.state == state)
+    return paginate(db, models_college.College, page, *criteria)
+
+
+@read_through("colleges")
+def match_colleges(
+    db: Session,
+    stream: str,
+    score: float,
+    degree: str | None = None,
+    state: str | None = None,
+    limit: int | None = None,
+):
+    criteria = [
+        CollegeDegree.cutoff_stream == stream,
+        CollegeDegree.cutoff <= score,
+    ]
+    if degree:
+        criteria.append(CollegeDegree.degree_name == degree)
     if state:
-        query = query.filter(models_college.College.state == state)
-    return query.all()
+        criteria.append(CollegeDegree.state == state)
+    # Highest cutoff the score still clears first: the most selective options.
+    stmt = (
+        select(models_college.College, CollegeDegree)
+        .join(
+            CollegeDegree, CollegeDegree.college_id == models_college.College.college_id
+        )
+        .where(*criteria)
+        .order_by(CollegeDegree.cutoff.desc(), models_college.College.college_id)
+        .limit(limit or settings.search_default_limit)
+    )
+    return [
+        {
+            "college": college,
+            "degree_name": degree_row.degree_name,
+            "cutoff": degree_row.cutoff,
+            "cutoff_stream": degree_row.cutoff_stream,
+            "margin": score - degree_row.cutoff,
+        }
+        for college, degree_row in db.execute(stmt).all()
+    ]
+
+
+def _non_empty_json_array(column, dialect: str):
+    # Excludes SQL NULL, JSON null and [] alike.
+    if dialect == "postgresql":
+        return and_(
+            func.json_typeof(column) == "array", func.json_array_length(column) > 0
+        )
+    if dialect == "sqlite":
+        return and_(
+            func.json_type(column) == "array", func.json_array_length(column) > 0
+        )
+    return column.is_not(None)
+
+
+def backfill_degree_index(db: Session) -> int:
+    # Colleges written outside create_college/ingest (or before
+    # college_degrees existed, or by an interrupted backfill) have no index
+    # rows; anti-join on them and index them a chunk at a time.
+    indexed = select(CollegeDegree.college_degree_id).where(
+        CollegeDegree.college_id == models_college.College.college_id
+    )
+    count, after = 0, 0
+    while True:
+        chunk = db.execute(
+            select(
+                models_college.College.college_id,
+                models_college.College.degrees,
+                models_college.College.state,
+            )
+            .where(
+                models_college.College.college_id > after,
+                _non_empty_json_array(
+                    models_college.College.degrees, db.get_bind().dialect.name
+                ),
+                ~indexed.exists(),
+            )
+            .order_by(models_college.College.college_id)
+            .limit(settings.export_chunk_size)
+        ).all()
+        if not chunk:
+            return count
+        rows = []
+        for college_id, degrees, state in chunk:
+            for row in models_college.degree_rows(degrees, state):
+                row.college_id = college_id
+                rows.append(row)
+        db.add_all(rows)
+        db.commit()
+        count += len(rows)
+        after = chunk[-1].college_id
+
+
+def backfill_coordinates(db: Session) -> int:
+    count, after = 0, 0
+    while True:
+        chunk = db.execute(
+            select(
+                models_college.College.college_id,
+                models_college.College.location,
+                models_college.College.district,
+                models_college.College.state,
+            )
+            .where(
+                models_college.College.college_id > after,
+                models_college.College.latitude.is_(None),
+                models_college.College.geocode_attempted.is_not(True),
+            )
+            .order_by(models_college.College.college_id)
+            .limit(settings.export_chunk_size)
+        ).all()
+        if not chunk:
+            return count
+        updates = []
+        for college_id, location, district, state in chunk:
+            point = geocode(location, district, state=state)
+            latitude, longitude = point or (None, None)
+            updates.append(
+                {
+                    "college_id": college_id,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "geocode_attempted": True,
+                }
+            )
+            count += point is not None
+        db.execute(update(models_college.College), updates)
+        db.commit()
+        after = chunk[-1].college_id
+
+
+@read_through("colleges")
+def get_colleges_by_ids(db: Session, college_ids: list[int]):
+    colleges = db.scalars(
+        select(models_college.College).where(
+            models_college.College.college_id.in_(college_ids)
+        )
+    ).all()
+    by_id = {college.college_id: college for college in colleges}
+    return [by_id[college_id] for college_id in college_ids if college_id in by_id]
@@ -2,6 +2,9 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 import models.course as model_course
+from crud.cache import read_through
+from crud.hooks import notify_write
+from crud.pagination import Page, PageQuery, paginate, plain_rows
 from schema.course import CourseBase, CourseResponse
 
 
@@ -14,24 +17,30 @@ def create_course(
         db.add(db_course)
         db.commit()
         db.refresh(db_course)
+        notify_write("courses", [db_course])
         return CourseResponse.model_validate(db_course)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_all_courses(db: Session) -> list[CourseResponse]:
+@read_through("courses")
+def get_all_courses(db: Session, page: PageQuery = PageQuery()) -> Page:
     try:
-        courses = db.query(model_course.Course).all()
-        return [CourseResponse.model_validate(course) for course in courses]
+        return paginate(
+            db,
+            model_course.Course,
+            plain_rows(page, CourseResponse, model_course.Course),
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@read_through("courses")
 def get_course_by_id(db: Session, course_id: int) -> CourseResponse:
     course = (
         db.query(model_course.Course)
-        .filter(model_course.Course.id == course_id)
+        .filter(model_course.Course.course_id == course_id)
         .first()
     )
     if not course:
@@ -0,0 +1,24 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any, Callable
+
+_listeners: dict[str, list[Callable[[list[Any]], None]]] = defaultdict(list)
+
+
+def on_write(table: str):
+    def register(listener: Callable[[list[Any]], None]):
+        _listeners[table].append(listener)
+        return listener
+
+    return register
+
+
+def notify_write(table: str, rows: list[Any] | None = None) -> None:
+    for listener in _listeners[table]:
+        listener(rows or [])
+
+
+def row_value(row: Any, key: str) -> Any:
+    if isinstance(row, Mapping):
+        return row.get(key)
+    return getattr(row, key, None)
@@ -0,0 +1,235 @@
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import BaseModel
+from sqlalchemy import column, delete, func, insert, select, table, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud.hooks import notify_write
+from models.college import College
+from models.college_degree import CollegeDegree
+from models.scholarship import Scholarship
+from schema.college import CollegeCreate
+from schema.scholarship import ScholarshipCreate
+from utils.geo import geocode
+
+UPSERT_INSERTS = {"postgresql": postgres_insert, "sqlite": sqlite_insert}
+
+
+def _college_row(row: dict) -> dict:
+    point = geocode(row["location"], row["district"], state=row["state"])
+    row["latitude"], row["longitude"] = point or (None, None)
+    row["geocode_attempted"] = True
+    return row
+
+
+def _sync_college_degrees(db: Session, rows: list) -> None:
+    college_ids = [row["college_id"] for row in rows]
+    db.execute(delete(CollegeDegree).where(CollegeDegree.college_id.in_(college_ids)))
+    degree_rows = [
+        {
+            "college_id": row["college_id"],
+            "degree_name": degree["degree_name"],
+            "cutoff": degree.get("cutoff"),
+            "cutoff_stream": degree.get("cutoff_stream"),
+            "state": row["state"],
+        }
+        for row in rows
+        for degree in row["degrees"] or []
+        if isinstance(degree, dict) and degree.get("degree_name")
+    ]
+    if degree_rows:
+        db.execute(insert(CollegeDegree), degree_rows)
+
+
+@dataclass(frozen=True)
+class IngestTarget:
+    model: Any
+    schema: type[BaseModel]
+    natural_key: tuple[str, ...]
+    prepare: Callable[[dict], dict] | None = None
+    after_write: Callable[[Session, list], None] | None = None
+
+
+INGEST_TARGETS = {
+    "colleges": IngestTarget(
+        College,
+        CollegeCreate,
+        ("college_name", "district"),
+        _college_row,
+        _sync_college_degrees,
+    ),
+    "scholarships": IngestTarget(
+        Scholarship,
+        ScholarshipCreate,
+        ("scholarship_name", "starting_date"),
+    ),
+}
+
+
+@dataclass
+class IngestReport:
+    table: str
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    rows: list = field(default_factory=list, repr=False)
+
+    def summary(self) -> dict:
+        return {
+            "table": self.table,
+            "received": self.received,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+        }
+
+
+def _chunks(records: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _row(target: IngestTarget, record: BaseModel | dict) -> dict:
+    # Records are validated schema objects, or dicts already validated and
+    # dumped elsewhere (see load_catalog.py).
+    row = record.model_dump() if isinstance(record, BaseModel) else dict(record)
+    if "updated_at" in target.model.__table__.c:
+        # Set explicitly: ON CONFLICT updates and COPY skip Python onupdate.
+        row["updated_at"] = datetime.now(timezone.utc)
+    return target.prepare(row) if target.prepare is not None else row
+
+
+def _dedupe(rows: list[dict], natural_key: tuple[str, ...]) -> list[dict]:
+    # ON CONFLICT cannot touch the same row twice in one statement; last wins.
+    return list({tuple(row[k] for k in natural_key): row for row in rows}.values())
+
+
+def _copy_value(value: Any) -> str:
+    # COPY's CSV format reads an unquoted empty field as NULL and a quoted one
+    # ("") as an empty string, so only None may be written unquoted.
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value)
+    elif isinstance(value, date):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_csv(rows: list[dict], columns: list[str]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_copy_value(row[name]) for name in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _upsert(db: Session, target: IngestTarget, rows: list[dict]) -> list:
+    model_table = target.model.__table__
+    dialect = db.get_bind().dialect
+    make_insert = UPSERT_INSERTS.get(dialect.name)
+    columns = list(rows[0])
+    if make_insert is None:
+        stmt = insert(model_table)
+    else:
+        stmt = make_insert(model_table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(target.natural_key),
+            set_={
+                name: stmt.excluded[name]
+                for name in columns
+                if name not in target.natural_key
+            },
+        )
+
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        # COPY the batch into a staging table, then upsert it in one statement.
+        buffer = _copy_csv(rows, columns)
+        column_list = ", ".join(columns)
+        cursor = db.connection().connection.dbapi_connection.cursor()
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS ingest_stage ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {model_table.name} WITH NO DATA"
+        )
+        cursor.copy_expert(
+            f"COPY ingest_stage ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        stage = table("ingest_stage", *[column(name) for name in columns])
+        stmt = stmt.from_select(columns, select(*stage.columns))
+        return db.execute(stmt.returning(*model_table.columns)).mappings().all()
+
+    # executemany with RETURNING: SQLAlchemy batches it into multi-row
+    # "insertmanyvalues" statements with a cached compiled form.
+    return db.execute(stmt.returning(*model_table.columns), rows).mappings().all()
+
+
+def ingest(
+    db: Session,
+    table_name: str,
+    records: Iterable,
+    chunk_size: int | None = None,
+    collect_rows: bool = False,
+    progress: Callable[[IngestReport], None] | None = None,
+) -> IngestReport:
+    target = INGEST_TARGETS[table_name]
+    report = IngestReport(table_name)
+    started = time.perf_counter()
+    key_columns = [getattr(target.model, name) for name in target.natural_key]
+
+    for chunk in _chunks(records, chunk_size or settings.ingest_chunk_size):
+        report.received += len(chunk)
+        report.batches += 1
+        rows = _dedupe([_row(target, record) for record in chunk], target.natural_key)
+        try:
+            existing = db.scalar(
+                select(func.count())
+                .select_from(target.model)
+                .where(
+                    tuple_(*key_columns).in_(
+                        [tuple(row[k] for k in target.natural_key) for row in rows]
+                    )
+                )
+            )
+            written = _upsert(db, target, rows)
+            if target.after_write is not None:
+                target.after_write(db, written)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            report.failed_batches += 1
+            report.errors.append(f"batch {report.batches}: {e}")
+        else:
+            report.inserted += len(written) - existing
+            report.updated += existing
+            notify_write(table_name, written)
+            if collect_rows:
+                report.rows.extend(written)
+        if progress is not None:
+            progress(report)
+
+    report.seconds = time.perf_counter() - started
+    return report
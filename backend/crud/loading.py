@@ -0,0 +1,21 @@
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from models.career import Career
+from models.course import Course
+
+RELATIONSHIPS = {Career: ("courses",), Course: ("careers",)}
+
+
+def load_options(model, include: tuple[str, ...] = (), single: bool = False) -> list:
+    # One extra SELECT ... IN for lists, a JOIN for single rows; anything not
+    # requested raises instead of lazily issuing a query per row.
+    options = []
+    for name in RELATIONSHIPS.get(model, ()):
+        attribute = getattr(model, name)
+        if name not in include:
+            options.append(raiseload(attribute))
+        elif single:
+            options.append(joinedload(attribute))
+        else:
+            options.append(selectinload(attribute))
+    return options
@@ -0,0 +1,74 @@
+from dataclasses import dataclass, replace
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    after: int | None = None
+    limit: int | None = None
+    fields: tuple[str, ...] | None = None
+    include_total: bool = False
+
+
+@dataclass
+class Page:
+    items: list[Any]
+    next_cursor: int | None = None
+    total: int | None = None
+    projected: bool = False
+
+
+def plain_rows(page: PageQuery, schema, model) -> PageQuery:
+    # Selecting every schema column yields plain dicts in schema field order,
+    # skipping ORM instances and per-row model validation.
+    if page.fields:
+        return page
+    columns = model.__table__.c
+    return replace(
+        page, fields=tuple(field for field in schema.model_fields if field in columns)
+    )
+
+
+def page_select(model, page: PageQuery, *extra) -> Select:
+    pk = model.__mapper__.primary_key[0]
+    if page.fields:
+        columns = [getattr(model, field) for field in page.fields]
+        return select(pk.label("_cursor"), *extra, *columns)
+    return select(model, pk.label("_cursor"), *extra)
+
+
+def page_item(row, page: PageQuery) -> Any:
+    if page.fields:
+        return {field: getattr(row, field) for field in page.fields}
+    return row[0]
+
+
+def paginate(db: Session, model, page: PageQuery, *criteria, options=()) -> Page:
+    pk = model.__mapper__.primary_key[0]
+    stmt = page_select(model, page).where(*criteria).order_by(pk)
+    if options and not page.fields:
+        stmt = stmt.options(*options)
+    if page.after is not None:
+        stmt = stmt.where(pk > page.after)
+    if page.limit is not None:
+        # One extra row tells us whether there is a next page.
+        stmt = stmt.limit(page.limit + 1)
+
+    rows = db.execute(stmt).all()
+    next_cursor = None
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = rows[-1]._cursor
+
+    total = None
+    if page.include_total:
+        total = db.scalar(select(func.count()).select_from(model).where(*criteria))
+    return Page(
+        [page_item(row, page) for row in rows],
+        next_cursor,
+        total,
+        projected=bool(page.fields),
+    )
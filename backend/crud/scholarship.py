@@ -1,54 +1,104 @@
+from datetime import date
+
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from crud.cache import read_through
+from crud.hooks import notify_write
+from crud.ingest import IngestReport, ingest
+from crud.pagination import Page, PageQuery, paginate
+from crud.search import ranked_search
 from models import scholarship as scholarship_model
 from schema.scholarship import ScholarshipCreate
 
 
-def create_scholarship_bulk(db: Session, scholarships: list[ScholarshipCreate]):
-    db_scholarships = [
-        scholarship_model.Scholarship(**scholarship.model_dump())
-        for scholarship in scholarships
-    ]
-    db.add_all(db_scholarships)
-    db.commit()
-    for scholarship in db_scholarships:
-        db.refresh(scholarship)
-    return db_scholarships
+def create_scholarship_bulk(
+    db: Session, scholarships: list[ScholarshipCreate]
+) -> IngestReport:
+    return ingest(db, "scholarships", scholarships, collect_rows=True)
 
 
 def create_scholarship(db: Session, scholarship: ScholarshipCreate):
     db_scholarship = scholarship_model.Scholarship(**scholarship.model_dump())
     db.add(db_scholarship)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Scholarship '{scholarship.scholarship_name}' starting "
+            f"{scholarship.starting_date} already exists; use the bulk endpoint "
+            "to update it",
+        )
     db.refresh(db_scholarship)
+    notify_write("scholarships", [db_scholarship])
     return db_scholarship
 
 
-def get_all_scholarships(db: Session):
-    return db.query(scholarship_model.Scholarship).all()
+@read_through("scholarships")
+def get_all_scholarships(db: Session, page: PageQuery = PageQuery()) -> Page:
+    return paginate(db, scholarship_model.Scholarship, page)
 
 
-def search_scholarship(db: Session, name: str):
-    return (
-        db.query(scholarship_model.Scholarship)
-        .filter(scholarship_model.Scholarship.scholarship_name.ilike(f"%{name}%"))
-        .all()
+@read_through("scholarships")
+def search_scholarship(db: Session, name: str, page: PageQuery = PageQuery()) -> Page:
+    return ranked_search(
+        db,
+        scholarship_model.Scholarship,
+        scholarship_model.Scholarship.scholarship_name,
+        name,
+        page,
     )
 
 
+def _json_list_match(db: Session, column, values: list[str], match_all: bool):
+    if db.get_bind().dialect.name == "postgresql":
+        # ?& / ?| are served by the GIN index on the JSONB column.
+        jsonb = type_coerce(column, JSONB)
+        return (
+            jsonb.has_all(array(values)) if match_all else jsonb.has_any(array(values))
+        )
+
+    def has(value: str):
+        elements = func.json_each(column).table_valued("value")
+        return select(1).select_from(elements).where(elements.c.value == value).exists()
+
+    combine = and_ if match_all else or_
+    return combine(*(has(value) for value in values))
+
+
+@read_through("scholarships")
 def filter_scholarship(
     db: Session,
-    eligibility: str | None = None,
-    start_after: str | None = None,
-    end_before: str | None = None,
-):
-    query = db.query(scholarship_model.Scholarship)
+    eligibility: list[str] | None = None,
+    start_after: date | None = None,
+    end_before: date | None = None,
+    page: PageQuery = PageQuery(),
+    documents: list[str] | None = None,
+    match: str = "all",
+    active_on: date | None = None,
+) -> Page:
+    scholarship = scholarship_model.Scholarship
+    criteria = []
     if eligibility:
-        query = query.filter(
-            scholarship_model.Scholarship.eligibility.ilike(f"%{eligibility}%")
+        criteria.append(
+            _json_list_match(db, scholarship.eligibility, eligibility, match == "all")
+        )
+    if documents:
+        criteria.append(
+            _json_list_match(
+                db, scholarship.required_documents, documents, match == "all"
+            )
         )
     if start_after:
-        query = query.filter(scholarship_model.Scholarship.starting_date >= start_after)
+        criteria.append(scholarship.starting_date >= start_after)
     if end_before:
-        query = query.filter(scholarship_model.Scholarship.ending_date <= end_before)
-    return query.all()
+        criteria.append(scholarship.ending_date <= end_before)
+    if active_on:
+        criteria.append(scholarship.starting_date <= active_on)
+        criteria.append(scholarship.ending_date >= active_on)
+    return paginate(db, scholarship, page, *criteria)
@@ -0,0 +1,134 @@
+import re
+
+from sqlalchemy import case, column, func, literal, literal_column, or_, table
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud.pagination import Page, PageQuery, page_item, page_select
+from db.search import fts_table
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _trigrams(value: str) -> set[str]:
+    # Same shape as pg_trgm: lowercase words padded with two leading and one
+    # trailing space.
+    grams = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _similarity(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def trigram_score(query: str, value: str | None) -> float:
+    if not value:
+        return 0.0
+    lowered, needle = value.lower(), query.lower()
+    if lowered.startswith(needle):
+        return 2.0
+    if needle in lowered:
+        return 1.5
+    query_grams = _trigrams(query)
+    words = _WORD.findall(value)
+    width = max(len(_WORD.findall(query)), 1)
+    # Best match against the whole value or any run of words as long as the
+    # query, so a typo in one word of a long name still scores well.
+    windows = [" ".join(words[i : i + width]) for i in range(len(words))]
+    return max(
+        _similarity(query_grams, _trigrams(window)) for window in [value, *windows]
+    )
+
+
+def _like_pattern(query: str) -> str:
+    return re.sub(r"([\\%_])", r"\\\1", query)
+
+
+def _postgres(
+    db: Session, model, search_column, query: str, page: PageQuery, limit: int
+):
+    pattern = _like_pattern(query)
+    score = case(
+        (search_column.ilike(f"{pattern}%", escape="\\"), 2.0),
+        (search_column.ilike(f"%{pattern}%", escape="\\"), 1.5),
+        else_=func.greatest(
+            func.similarity(search_column, query),
+            func.word_similarity(query, search_column),
+        ),
+    )
+    pk = model.__mapper__.primary_key[0]
+    # Every branch is answerable from the pg_trgm GIN index on the column.
+    stmt = (
+        page_select(model, page)
+        .where(
+            or_(
+                search_column.ilike(f"%{pattern}%", escape="\\"),
+                search_column.op("%")(query),
+                literal(query).op("<%")(search_column),
+            )
+        )
+        .order_by(score.desc(), pk)
+        .limit(limit)
+    )
+    return db.execute(stmt).all()
+
+
+def _sqlite(db: Session, model, search_column, query: str, page: PageQuery, limit: int):
+    fts = fts_table(model.__tablename__)
+    index = table(fts, column("rowid"))
+    pk = model.__mapper__.primary_key[0]
+    # OR-ing the query's trigrams lets FTS5 find near-misses as well as exact
+    # substrings; bm25 puts rows sharing the most trigrams first.
+    grams = {query.lower()[i : i + 3] for i in range(len(query) - 2)}
+    expression = " OR ".join('"' + gram.replace('"', '""') + '"' for gram in grams)
+    stmt = (
+        page_select(model, page, search_column.label("_text"))
+        .join(index, index.c.rowid == pk)
+        .where(literal_column(fts).op("MATCH")(expression))
+        .order_by(func.bm25(literal_column(fts)), pk)
+        .limit(limit * settings.search_candidate_factor)
+    )
+    scored = [(trigram_score(query, row._text), row) for row in db.execute(stmt)]
+    scored = [item for item in scored if item[0] >= settings.search_min_similarity]
+    scored.sort(key=lambda item: (-item[0], item[1]._cursor))
+    return [row for _, row in scored[:limit]]
+
+
+def _like(db: Session, model, search_column, query: str, page: PageQuery, limit: int):
+    pattern = _like_pattern(query)
+    pk = model.__mapper__.primary_key[0]
+    stmt = (
+        page_select(model, page)
+        .where(search_column.ilike(f"%{pattern}%", escape="\\"))
+        .order_by(
+            case((search_column.ilike(f"{pattern}%", escape="\\"), 0), else_=1),
+            search_column,
+            pk,
+        )
+        .limit(limit)
+    )
+    return db.execute(stmt).all()
+
+
+def ranked_search(
+    db: Session, model, search_column, query: str, page: PageQuery
+) -> Page:
+    query = query.strip()
+    limit = page.limit or settings.search_default_limit
+    dialect = db.get_bind().dialect.name
+    if not query:
+        rows = []
+    elif dialect == "postgresql":
+        rows = _postgres(db, model, search_column, query, page, limit)
+    elif dialect == "sqlite" and len(query) >= 3:
+        rows = _sqlite(db, model, search_column, query, page, limit)
+    else:
+        # Too short for trigrams (or an unknown backend): prefix first, then
+        # substring matches.
+        rows = _like(db, model, search_column, query, page, limit)
+    return Page([page_item(row, page) for row in rows], projected=bool(page.fields))
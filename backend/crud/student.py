@@ -3,7 +3,6 @@ from sqlalchemy.orm import Session
 
 import models.student as model_student
 from schema.student import StudentCreate
-from utils.hashing import hash_password
 
 
 def get_student_by_email(db: Session, email: str):
@@ -14,7 +13,11 @@ def get_student_by_email(db: Session, email: str):
     )
 
 
-def create_student(db: Session, student: StudentCreate):
+def get_student_by_id(db: Session, student_id: int):
+    return db.get(model_student.Student, student_id)
+
+
+def create_student(db: Session, student: StudentCreate, hashed_password: str):
     try:
         db_student = model_student.Student(
             name=student.name,
@@ -22,7 +25,7 @@ def create_student(db: Session, student: StudentCreate):
             age=student.age,
             class_name=student.class_name,
             city=student.city,
-            password=hash_password(student.password),
+            password=hashed_password,
         )
         db.add(db_student)
         db.commit()
@@ -32,3 +35,12 @@ def create_student(db: Session, student: StudentCreate):
         db.rollback()
         print(f"Error creating student: {e}")
         raise HTTPException(status_code=500, detail="Failed to create student")
+
+
+def update_password(
+    db: Session, db_student: model_student.Student, hashed_password: str
+):
+    db_student.password = hashed_password  # type: ignore
+    db.commit()
+    db.refresh(db_student)
+    return db_student
@@ -0,0 +1,43 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from core.config import settings
+from db.database import engine_options
+from db.metrics import pool_metrics
+
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{url.drivername}'")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_engine_for(database_url: str) -> AsyncEngine:
+    async_url = async_database_url(database_url)
+    async_engine = create_async_engine(
+        async_url, **engine_options(async_url, asynchronous=True)
+    )
+    event.listen(
+        async_engine.sync_engine, "connect", lambda *_: pool_metrics.record_connect()
+    )
+    event.listen(
+        async_engine.sync_engine,
+        "invalidate",
+        lambda *_: pool_metrics.record_invalidation(),
+    )
+    return async_engine
+
+
+async_engine = create_engine_for(settings.database_url) if settings.db_async else None
+# Objects outlive the session's greenlet once handlers return, so they must not
+# expire on commit or serialization would trigger lazy IO outside of it.
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
@@ -1,9 +1,84 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from core.config import settings
+from db.metrics import pool_metrics
+
+
+class _InstrumentedPool:
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(database_url: str, asynchronous: bool = False) -> dict:
+    url = make_url(database_url)
+    options: dict = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    if settings.db_isolation_level:
+        options["isolation_level"] = settings.db_isolation_level
+
+    # In-memory SQLite lives in a single connection, so there is no pool to size.
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+    )
+    if url.get_backend_name() == "postgresql" and settings.db_statement_timeout_ms:
+        timeout = settings.db_statement_timeout_ms
+        options["connect_args"] = (
+            {"server_settings": {"statement_timeout": str(timeout)}}
+            if asynchronous
+            else {"options": f"-c statement_timeout={timeout}"}
+        )
+    return options
+
+
+def pool_status(engine: Engine) -> dict:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "saturation": round(pool.checkedout() / capacity, 3) if capacity else 0.0,
+        **pool_metrics.snapshot(),
+    }
+
 
-engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+event.listen(engine, "connect", lambda *_: pool_metrics.record_connect())
+event.listen(engine, "invalidate", lambda *_: pool_metrics.record_invalidation())
 SessionLocal = sessionmaker(autoflush=False, bind=engine)
 Base = declarative_base()
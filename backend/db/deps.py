@@ -1,3 +1,6 @@
+from fastapi.concurrency import run_in_threadpool
+
+from .async_database import AsyncSessionLocal
 from .database import SessionLocal
 
 
@@ -7,3 +10,23 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database stack is disabled; set DB_ASYNC=true")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_session():
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
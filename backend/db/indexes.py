@@ -0,0 +1,110 @@
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from db.search import install_search_indexes
+
+logger = logging.getLogger(__name__)
+
+# Natural keys used by bulk upserts (ON CONFLICT needs a unique index).
+NATURAL_KEYS = {
+    "uq_colleges_name_district": ("colleges", "college_name, district"),
+    "uq_scholarships_name_start": ("scholarships", "scholarship_name, starting_date"),
+}
+
+JSONB_COLUMNS = {"scholarships": ("eligibility", "required_documents")}
+
+# Columns added after the first release; create_all() never alters tables.
+ADDED_COLUMNS = {
+    "colleges": {
+        "latitude": "FLOAT",
+        "longitude": "FLOAT",
+        "updated_at": "TIMESTAMP",
+        "geocode_attempted": "BOOLEAN",
+    },
+    "scholarships": {"updated_at": "TIMESTAMP"},
+}
+
+
+def _add_missing_columns(engine: Engine) -> None:
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, column_type in columns.items():
+                if name not in existing:
+                    connection.execute(
+                        text(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+                    )
+                    if name == "updated_at":
+                        connection.execute(
+                            text(f"UPDATE {table} SET updated_at = CURRENT_TIMESTAMP")
+                        )
+
+
+def _install_postgres_jsonb(connection) -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            # Tables created before the JSONB variant still hold plain json.
+            data_type = connection.execute(
+                text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = :table AND column_name = :column"
+                ),
+                {"table": table, "column": column},
+            ).scalar()
+            if data_type == "json":
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} "
+                        f"TYPE jsonb USING {column}::jsonb"
+                    )
+                )
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_gin "
+                    f"ON {table} USING gin ({column})"
+                )
+            )
+
+
+def _install_natural_keys(engine: Engine) -> None:
+    for name, (table, columns) in NATURAL_KEYS.items():
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    text(
+                        f"CREATE UNIQUE INDEX IF NOT EXISTS {name} "
+                        f"ON {table} ({columns})"
+                    )
+                )
+        except IntegrityError:
+            logger.warning(
+                "%s has duplicate (%s) rows; bulk upserts into it will fail "
+                "until they are removed",
+                table,
+                columns,
+            )
+
+
+def install_indexes(engine: Engine) -> None:
+    _add_missing_columns(engine)
+    _install_natural_keys(engine)
+    install_search_indexes(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_scholarships_active_window "
+                "ON scholarships (starting_date, ending_date)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_scholarships_ending_date "
+                "ON scholarships (ending_date)"
+            )
+        )
+        if engine.dialect.name == "postgresql":
+            _install_postgres_jsonb(connection)
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.job import Job
+
+
+def _utcnow() -> datetime:
+    # Job timestamps are compared in SQL, so keep them naive UTC on every backend.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enqueue(
+    db: Session, kind: str, payload: dict, max_attempts: int | None = None
+) -> Job:
+    job = Job(
+        kind=kind,
+        payload=payload,
+        status="queued",
+        max_attempts=max_attempts or settings.job_max_attempts,
+        run_after=_utcnow(),
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_job(db: Session, job_id: int) -> Job | None:
+    return db.get(Job, job_id)
+
+
+def _stale(now: datetime):
+    cutoff = now - timedelta(seconds=settings.job_lock_timeout_seconds)
+    return and_(Job.status == "running", Job.locked_at < cutoff)
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(Job.status == "queued", Job.run_after <= now),
+        # Jobs whose worker died mid-run are picked up again while they still
+        # have attempts left.
+        and_(_stale(now), Job.attempts < Job.max_attempts),
+    )
+
+
+def _fail_exhausted(db: Session, now: datetime) -> None:
+    # A job that kept crashing its worker would otherwise sit in "running".
+    failed = db.execute(
+        update(Job)
+        .where(_stale(now), Job.attempts >= Job.max_attempts)
+        .values(
+            status="failed",
+            error="worker lock expired on the final attempt",
+            locked_by=None,
+        )
+    )
+    if failed.rowcount:
+        db.commit()
+
+
+def claim(db: Session, worker_id: str) -> Job | None:
+    now = _utcnow()
+    _fail_exhausted(db, now)
+    candidates = (
+        select(Job).where(_claimable(now)).order_by(Job.run_after, Job.job_id).limit(1)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        job = db.scalars(candidates.with_for_update(skip_locked=True)).first()
+        if job is None:
+            db.rollback()
+            return None
+    else:
+        # SQLite has no row locks; the conditional UPDATE below is the claim,
+        # since writers are serialized and only one of them can match.
+        job_id = db.scalars(candidates.with_only_columns(Job.job_id)).first()
+        if job_id is None:
+            return None
+        claimed = db.execute(
+            update(Job)
+            .where(Job.job_id == job_id, _claimable(now))
+            .values(status="running", locked_by=worker_id, locked_at=now)
+        )
+        if claimed.rowcount != 1:
+            db.rollback()
+            return None
+        job = db.get(Job, job_id)
+
+    job.status = "running"
+    job.locked_by = worker_id
+    job.locked_at = now
+    job.attempts += 1
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def heartbeat(db: Session, job_id: int, worker_id: str) -> bool:
+    # Renews the lock of a long-running job; False means another worker owns it.
+    renewed = db.execute(
+        update(Job)
+        .where(
+            Job.job_id == job_id,
+            Job.locked_by == worker_id,
+            Job.status == "running",
+        )
+        .values(locked_at=_utcnow())
+    )
+    db.commit()
+    return renewed.rowcount == 1
+
+
+# complete() and fail() only apply while the caller still holds the lock; a
+# worker whose lock expired and was re-claimed must not overwrite the new
+# owner's outcome. Both return whether the update applied.
+
+
+def complete(
+    db: Session, job_id: int, worker_id: str, result: dict | list | None
+) -> bool:
+    updated = db.execute(
+        update(Job)
+        .where(Job.job_id == job_id, Job.locked_by == worker_id)
+        .values(status="succeeded", result=result, error=None, locked_by=None)
+    )
+    db.commit()
+    return updated.rowcount == 1
+
+
+def fail(db: Session, job_id: int, worker_id: str, error: str) -> bool:
+    job = db.get(Job, job_id)
+    if job is None or job.locked_by != worker_id:
+        return False
+    values = {"error": error, "locked_by": None}
+    if job.attempts >= job.max_attempts:
+        values["status"] = "failed"
+    else:
+        backoff = settings.job_retry_backoff_seconds * 2 ** (job.attempts - 1)
+        values["status"] = "queued"
+        values["run_after"] = _utcnow() + timedelta(seconds=backoff)
+    updated = db.execute(
+        update(Job)
+        .where(
+            Job.job_id == job_id,
+            Job.locked_by == worker_id,
+            Job.attempts == job.attempts,
+        )
+        .values(**values)
+    )
+    db.commit()
+    return updated.rowcount == 1
@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+
+# Set per request by the middleware; threadpool and greenlet hops copy the
+# context, so they all increment the same counter.
+_counter: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(*_) -> None:
+    counter = _counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+@contextmanager
+def uncounted():
+    # For bookkeeping queries (cache validators) that are not part of the
+    # endpoint's own loading pattern.
+    token = _counter.set(None)
+    try:
+        yield
+    finally:
+        _counter.reset(token)
+
+
+def query_budget(limit: int):
+    def dependency(request: Request) -> None:
+        request.state.query_budget = limit
+
+    return dependency
+
+
+async def enforce_query_budget(request: Request, call_next):
+    counter = QueryCounter()
+    token = _counter.set(counter)
+    try:
+        response = await call_next(request)
+    finally:
+        _counter.reset(token)
+    budget = getattr(request.state, "query_budget", settings.query_budget_default)
+    response.headers["X-Query-Count"] = str(counter.count)
+    if budget is not None and counter.count > budget:
+        raise QueryBudgetExceeded(
+            f"{request.method} {request.url.path} ran {counter.count} queries "
+            f"(budget {budget})"
+        )
+    return response
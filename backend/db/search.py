@@ -0,0 +1,68 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# Table -> (primary key, searchable text column)
+SEARCH_COLUMNS = {
+    "colleges": ("college_id", "college_name"),
+    "scholarships": ("scholarship_id", "scholarship_name"),
+}
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def _install_postgres(connection) -> None:
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for table, (_, column) in SEARCH_COLUMNS.items():
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+        )
+
+
+def _install_sqlite(connection) -> None:
+    for table, (pk, column) in SEARCH_COLUMNS.items():
+        fts = fts_table(table)
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts},
+        ).first()
+        if exists:
+            continue
+
+        # External-content FTS5 index kept in sync by triggers on the base table.
+        connection.execute(
+            text(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({column}, content='{table}', "
+                f"content_rowid='{pk}', tokenize='trigram')"
+            )
+        )
+        insert = f"INSERT INTO {fts}(rowid, {column}) VALUES (new.{pk}, new.{column});"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {column}) "
+            f"VALUES ('delete', old.{pk}, old.{column});"
+        )
+        connection.execute(
+            text(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END")
+        )
+        connection.execute(
+            text(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END")
+        )
+        connection.execute(
+            text(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} "
+                f"BEGIN {delete} {insert} END"
+            )
+        )
+        connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def install_search_indexes(engine: Engine) -> None:
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            _install_postgres(connection)
+        elif engine.dialect.name == "sqlite":
+            _install_sqlite(connection)
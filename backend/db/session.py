@@ -0,0 +1,18 @@
+from typing import Any, Callable, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+AnySession = Session | AsyncSession
+
+
+async def run_db(db: AnySession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # CRUD functions are written once against Session. On the async stack they
+    # run through AsyncSession.run_sync, which drives the same ORM code over the
+    # async driver without a threadpool thread; otherwise they go to the pool.
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
@@ -0,0 +1,173 @@
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, get_origin
+
+from pydantic import BaseModel, ValidationError
+
+from schema.college import CollegeCreate
+from schema.scholarship import ScholarshipCreate
+
+logger = logging.getLogger("load_catalog")
+
+SCHEMAS: dict[str, type[BaseModel]] = {
+    "colleges": CollegeCreate,
+    "scholarships": ScholarshipCreate,
+}
+
+Record = tuple[int, dict]
+
+NOT_AN_OBJECT = "expected a JSON object"
+
+
+def read_records(path: Path, fmt: str) -> Iterator[Record]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        if fmt == "csv":
+            # Line 1 is the header row.
+            for line, row in enumerate(csv.DictReader(handle), start=2):
+                yield line, row
+            return
+        for line, text in enumerate(handle, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as e:
+                yield line, {"_raw": text.rstrip("\n"), "_error": str(e)}
+                continue
+            if not isinstance(record, dict):
+                record = {"_raw": text.rstrip("\n"), "_error": NOT_AN_OBJECT}
+            yield line, record
+
+
+def _coerce_csv_lists(schema: type[BaseModel], row: dict) -> dict:
+    # CSV cells hold list fields as JSON ("[...]") or "|"-separated text.
+    for name, field in schema.model_fields.items():
+        value = row.get(name)
+        if not isinstance(value, str) or get_origin(field.annotation) is not list:
+            continue
+        value = value.strip()
+        if value.startswith("["):
+            row[name] = json.loads(value)
+        else:
+            row[name] = [item.strip() for item in value.split("|") if item.strip()]
+    return row
+
+
+def validate_chunk(table: str, records: list[Record]) -> tuple[list[dict], list[dict]]:
+    schema = SCHEMAS[table]
+    valid, rejected = [], []
+    for line, row in records:
+        if not isinstance(row, dict):
+            row = {"_raw": row, "_error": NOT_AN_OBJECT}
+        if "_error" in row:
+            rejected.append(
+                {"line": line, "record": row["_raw"], "errors": row["_error"]}
+            )
+            continue
+        try:
+            valid.append(
+                schema.model_validate(_coerce_csv_lists(schema, dict(row))).model_dump()
+            )
+        except (ValidationError, ValueError) as e:
+            errors = (
+                json.loads(e.json(include_url=False))
+                if isinstance(e, ValidationError)
+                else str(e)
+            )
+            rejected.append({"line": line, "record": row, "errors": errors})
+    return valid, rejected
+
+
+def validated(
+    table: str,
+    records: Iterator[Record],
+    chunk_size: int,
+    workers: int,
+    rejects,
+    counts: dict,
+) -> Iterator[dict]:
+    # Keep a bounded window of chunks in flight so the file is streamed, not
+    # loaded, while results still come back in input order.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending: deque = deque()
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(validate_chunk, table, chunk))
+            if not pending:
+                return
+            valid, rejected = pending.popleft().result()
+            for reject in rejected:
+                rejects.write(json.dumps(reject, default=str) + "\n")
+            counts["rejected"] += len(rejected)
+            yield from valid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load colleges or scholarships from CSV/JSONL files."
+    )
+    parser.add_argument("table", choices=sorted(SCHEMAS))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=("csv", "jsonl"))
+    parser.add_argument("--rejects", type=Path)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int)
+    args = parser.parse_args()
+
+    import crud.cache  # noqa: F401  (bumps shared table versions on write)
+    from core.config import settings
+    from crud.ingest import ingest
+    from db.database import Base, SessionLocal, engine
+    from db.indexes import install_indexes
+
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "jsonl")
+    rejects_path = args.rejects or args.path.with_suffix(".rejects.jsonl")
+    chunk_size = args.chunk_size or settings.ingest_chunk_size
+
+    Base.metadata.create_all(bind=engine)
+    install_indexes(engine)
+
+    counts = {"rejected": 0}
+    with rejects_path.open("w", encoding="utf-8") as rejects, SessionLocal() as db:
+        report = ingest(
+            db,
+            args.table,
+            validated(
+                args.table,
+                read_records(args.path, fmt),
+                chunk_size,
+                max(1, args.workers),
+                rejects,
+                counts,
+            ),
+            chunk_size=chunk_size,
+            progress=lambda r: logger.info(
+                "batch %d: %d rows, %d inserted, %d updated, %d failed batches",
+                r.batches,
+                r.received,
+                r.inserted,
+                r.updated,
+                r.failed_batches,
+            ),
+        )
+    report.rejected = counts["rejected"]
+    print(json.dumps(report.summary(), indent=2))
+    if report.rejected:
+        logger.warning("%d rejected rows written to %s", report.rejected, rejects_path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -1,19 +1,57 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 
 from api import (
+    autocomplete,
     career,
     college,
     course,
     course_career,
+    health,
+    job,
     recommendation,
     scholarship,
     student,
 )
-from db.database import Base, engine
+from core.config import settings
+from crud.college import backfill_coordinates, backfill_degree_index
+from db.async_database import async_engine
+from db.database import Base, SessionLocal, engine
+from db.indexes import install_indexes
+from db.query_budget import enforce_query_budget
+from utils.autocomplete import build_autocomplete_index
+from utils.geo import build_geo_index
+from utils.hashing import shutdown_hash_pool
 
 Base.metadata.create_all(bind=engine)
+install_indexes(engine)
+with SessionLocal() as db:
+    backfill_degree_index(db)
+    backfill_coordinates(db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.bulk_job_backend == "inline" and settings.web_concurrency > 1:
+        # Inline bulk jobs live in one process's memory; a poll routed to any
+        # other worker would 404.
+        raise RuntimeError(
+            "BULK_JOB_BACKEND=inline needs a single API process; "
+            "use BULK_JOB_BACKEND=queue with WEB_CONCURRENCY > 1"
+        )
+    await run_in_threadpool(build_autocomplete_index)
+    await run_in_threadpool(build_geo_index)
+    yield
+    shutdown_hash_pool()
+    if async_engine is not None:
+        await async_engine.dispose()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+if settings.query_budget_enforce:
+    app.middleware("http")(enforce_query_budget)
 
 app.include_router(student.router, prefix="/v1/api/student", tags=["students"])
 app.include_router(course.router, prefix="/v1/api/course", tags=["courses"])
@@ -26,3 +64,8 @@ app.include_router(college.router, prefix="/v1/api/college", tags=["colleges"])
 app.include_router(
     scholarship.router, prefix="/v1/api/scholarship", tags=["scholarships"]
 )
+app.include_router(job.router, prefix="/v1/api/job", tags=["jobs"])
+app.include_router(health.router, prefix="/health", tags=["health"])
+app.include_router(
+    autocomplete.router, prefix="/v1/api/autocomplete", tags=["autocomplete"]
+)
@@ -1,8 +1,19 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import relationship
 
 from db.database import Base
+from models.college_degree import CollegeDegree
 
 
 class College(Base):
@@ -15,4 +26,34 @@ class College(Base):
     state = Column(String, nullable=True)
     degrees = Column(JSON, nullable=True)
     facilities = Column(JSON, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    # Set once the gazetteer has been tried, found or not, so rows it cannot
+    # place are not looked up again on every start.
+    geocode_attempted = Column(Boolean, nullable=True, default=False)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    degree_index = relationship(
+        CollegeDegree, cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint("college_name", "district", name="uq_colleges_name_district"),
+    )
+
+
+def degree_rows(degrees, state) -> list[CollegeDegree]:
+    return [
+        CollegeDegree(
+            degree_name=degree["degree_name"],
+            cutoff=degree.get("cutoff"),
+            cutoff_stream=degree.get("cutoff_stream"),
+            state=state,
+        )
+        for degree in degrees or []
+        if isinstance(degree, dict) and degree.get("degree_name")
+    ]
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+
+from db.database import Base
+
+
+# Normalized copy of College.degrees (plus the college's state) so cutoff
+# matching can run off composite indexes instead of scanning the JSON.
+class CollegeDegree(Base):
+    __tablename__ = "college_degrees"
+
+    college_degree_id = Column(Integer, primary_key=True, autoincrement=True)
+    college_id = Column(
+        Integer,
+        ForeignKey("colleges.college_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    degree_name = Column(String, nullable=False)
+    cutoff = Column(Integer, nullable=True)
+    cutoff_stream = Column(String, nullable=True)
+    state = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_college_degrees_match",
+            "degree_name",
+            "cutoff_stream",
+            "cutoff",
+            "state",
+        ),
+        Index("ix_college_degrees_stream", "cutoff_stream", "state", "cutoff"),
+    )
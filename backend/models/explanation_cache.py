@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, String, Text
+
+from db.database import Base
+
+
+class ExplanationCacheEntry(Base):
+    __tablename__ = "explanation_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    explanation = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), index=True
+    )
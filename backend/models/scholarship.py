@@ -1,7 +1,24 @@
-from sqlalchemy import JSON, Column, Date, Float, Integer, String
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from db.database import Base
 
+# JSONB on Postgres so eligibility/documents can be GIN-indexed and queried
+# with containment; plain JSON elsewhere.
+JSONList = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Scholarship(Base):
     __tablename__ = "scholarships"
@@ -11,5 +28,18 @@ class Scholarship(Base):
     starting_date = Column(Date)
     ending_date = Column(Date)
     amount = Column(Float)
-    eligibility = Column(JSON)
-    required_documents = Column(JSON)
+    eligibility = Column(JSONList)
+    required_documents = Column(JSONList)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        Index("ix_scholarships_active_window", "starting_date", "ending_date"),
+        Index("ix_scholarships_ending_date", "ending_date"),
+        UniqueConstraint(
+            "scholarship_name", "starting_date", name="uq_scholarships_name_start"
+        ),
+    )
@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, String
+
+from db.database import Base
+
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class AutocompleteSuggestion(BaseModel):
+    kind: str
+    label: str
+    id: Optional[int] = None
@@ -24,5 +24,20 @@ class CollegeCreate(CollegeBase):
 
 class CollegeOut(CollegeBase):
     college_id: int
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     model_config = {"from_attributes": True}
+
+
+class CollegeMatch(BaseModel):
+    college: CollegeOut
+    degree_name: str
+    cutoff: int
+    cutoff_stream: str
+    margin: float
+
+
+class CollegeNearby(BaseModel):
+    college: CollegeOut
+    distance_km: float
@@ -0,0 +1,14 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class GraphNode(BaseModel):
+    kind: str
+    label: str
+    depth: Optional[int] = None
+
+
+class GraphPath(BaseModel):
+    length: int
+    nodes: List[GraphNode]
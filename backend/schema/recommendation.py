@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 
@@ -10,3 +10,26 @@ class RecommendationRequest(BaseModel):
 class RecommendationResult(BaseModel):
     recommended_stream: str
     ai_reasoning: str
+
+
+class BulkRecommendationResult(BaseModel):
+    job_id: str
+    recommended_streams: list[str]
+
+
+class BulkExplanation(BaseModel):
+    index: int
+    recommended_stream: str
+    ai_reasoning: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkExplanationPage(BaseModel):
+    job_id: str
+    status: str
+    total: int
+    unique_prompts: int
+    completed_prompts: int
+    offset: int
+    limit: int
+    results: list[BulkExplanation]
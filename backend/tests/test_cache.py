@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import crud.course as crud_course
+from crud.cache import catalog_cache
+from crud.hooks import notify_write
+from db.database import Base
+from models.course import Course
+from schema.course import CourseBase
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    # Keys carry table versions, not the engine, so entries from another
+    # test's database would otherwise be served here.
+    catalog_cache.clear()
+    yield
+    catalog_cache.clear()
+
+
+def misses() -> int:
+    return catalog_cache.stats()["misses"]
+
+
+def test_notify_write_makes_the_next_read_miss():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.execute(insert(Course), [{"course_name": "B.Sc.", "stream": "Science"}])
+        db.commit()
+
+        first = crud_course.get_all_courses(db)
+        before = misses()
+        assert crud_course.get_all_courses(db) == first
+        assert misses() == before
+
+        # A write that bypassed the crud layer is invisible until notified.
+        db.execute(insert(Course), [{"course_name": "B.Com.", "stream": "Commerce"}])
+        db.commit()
+        assert len(crud_course.get_all_courses(db).items) == 1
+
+        notify_write("courses")
+        fresh = crud_course.get_all_courses(db)
+
+    assert misses() == before + 1
+    assert [course["course_name"] for course in fresh.items] == ["B.Sc.", "B.Com."]
+
+
+def test_crud_writes_invalidate_cached_reads():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        assert crud_course.get_all_courses(db).items == []
+
+        crud_course.create_course(
+            db,
+            CourseBase(
+                course_name="B.A.", stream="Arts", description="Three-year degree"
+            ),
+        )
+
+        assert [c["course_name"] for c in crud_course.get_all_courses(db).items] == [
+            "B.A."
+        ]
@@ -0,0 +1,63 @@
+import csv
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from crud.ingest import _copy_csv, ingest
+from db.database import Base
+from models.college import College
+from schema.college import CollegeCreate
+
+
+def test_copy_csv_writes_none_unquoted_and_values_quoted():
+    rows = [
+        {
+            "college_name": 'Govt "Model" College',
+            "latitude": None,
+            "longitude": 74.79,
+            "cutoff_stream": None,
+            "location": "",
+            "facilities": ["Library"],
+            "starting_date": date(2025, 1, 1),
+        }
+    ]
+    columns = list(rows[0])
+
+    line = _copy_csv(rows, columns).getvalue()
+
+    # COPY ... WITH (FORMAT csv) loads the unquoted empty fields as NULL and
+    # the quoted "" as an empty string.
+    assert line == (
+        '"Govt ""Model"" College",,"74.79",,"",' '"[""Library""]","2025-01-01"\n'
+    )
+    assert next(csv.reader([line])) == [
+        'Govt "Model" College',
+        "",
+        "74.79",
+        "",
+        "",
+        '["Library"]',
+        "2025-01-01",
+    ]
+
+
+def test_ingest_keeps_missing_coordinates_null():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    college = CollegeCreate(
+        college_name="Nowhere College",
+        location="Unmapped Village",
+        district="Unmapped",
+        state="Nowhere",
+        facilities=[],
+        degrees=[],
+    )
+
+    with Session(engine) as db:
+        report = ingest(db, "colleges", [college])
+        row = db.execute(select(College.latitude, College.longitude)).one()
+
+    assert report.inserted == 1 and report.failed_batches == 0
+    assert row == (None, None)
@@ -0,0 +1,42 @@
+import json
+
+from load_catalog import NOT_AN_OBJECT, read_records, validate_chunk
+
+COLLEGE = {
+    "college_name": "Govt Degree College",
+    "location": "Sopore",
+    "district": "Baramulla",
+    "state": "Jammu and Kashmir",
+    "facilities": ["Library"],
+    "degrees": [],
+}
+
+
+def test_non_object_jsonl_lines_are_rejected_not_fatal(tmp_path):
+    path = tmp_path / "colleges.jsonl"
+    path.write_text(
+        "\n".join(["42", "[1]", '"text"', "null", json.dumps(COLLEGE), "{bad"]) + "\n",
+        encoding="utf-8",
+    )
+
+    valid, rejected = validate_chunk("colleges", list(read_records(path, "jsonl")))
+
+    assert [row["college_name"] for row in valid] == ["Govt Degree College"]
+    assert [(r["line"], r["record"]) for r in rejected] == [
+        (1, "42"),
+        (2, "[1]"),
+        (3, '"text"'),
+        (4, "null"),
+        (6, "{bad"),
+    ]
+    assert all(r["errors"] == NOT_AN_OBJECT for r in rejected[:4])
+
+
+def test_validate_chunk_rejects_records_that_are_not_dicts():
+    valid, rejected = validate_chunk("colleges", [(1, 42), (2, [1]), (3, COLLEGE)])
+
+    assert len(valid) == 1
+    assert [(r["line"], r["errors"]) for r in rejected] == [
+        (1, NOT_AN_OBJECT),
+        (2, NOT_AN_OBJECT),
+    ]
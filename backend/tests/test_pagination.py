@@ -0,0 +1,63 @@
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from crud.pagination import PageQuery, paginate
+from db.database import Base
+from models.course import Course
+
+
+def add_courses(db: Session, names: list[str]) -> None:
+    db.execute(
+        insert(Course),
+        [{"course_name": name, "stream": "Science"} for name in names],
+    )
+    db.commit()
+
+
+def test_cursor_pages_are_stable_across_inserts():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        add_courses(db, [f"Course {i}" for i in range(5)])
+        fields = ("course_id", "course_name")
+
+        first = paginate(db, Course, PageQuery(limit=2, fields=fields))
+        # Rows written between requests land after the cursor, so the next
+        # page neither repeats nor skips anything already listed.
+        add_courses(db, ["Late 1", "Late 2"])
+        second = paginate(
+            db, Course, PageQuery(after=first.next_cursor, limit=2, fields=fields)
+        )
+        rest = paginate(
+            db, Course, PageQuery(after=second.next_cursor, limit=10, fields=fields)
+        )
+
+    names = [row["course_name"] for page in (first, second, rest) for row in page.items]
+    assert names == [f"Course {i}" for i in range(5)] + ["Late 1", "Late 2"]
+    assert first.next_cursor == 2
+    assert second.next_cursor == 4
+    assert rest.next_cursor is None
+
+
+def test_include_total_counts_matching_rows_not_the_page():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        add_courses(db, [f"Course {i}" for i in range(5)])
+
+        counted = paginate(
+            db,
+            Course,
+            PageQuery(after=1, limit=2, include_total=True),
+            Course.course_name != "Course 4",
+        )
+        uncounted = paginate(db, Course, PageQuery(limit=2))
+
+    assert [course.course_name for course in counted.items] == [
+        "Course 1",
+        "Course 2",
+    ]
+    assert counted.total == 4
+    assert counted.projected is False
+    assert uncounted.total is None
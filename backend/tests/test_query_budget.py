@@ -0,0 +1,110 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import crud.career as crud_career
+from api import career, course
+from core.config import settings
+from db.database import Base
+from db.deps import get_session
+from db.query_budget import QueryBudgetExceeded, enforce_query_budget
+from models.career import Career
+from models.career_course import career_courses
+from models.course import Course
+
+ROWS = 6
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Every request must hit the database, or a cached result would hide the
+    # queries the budget is meant to count.
+    monkeypatch.setattr(settings, "catalog_cache_enabled", False)
+    monkeypatch.setattr(settings, "query_budget_enforce", True)
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.execute(
+            insert(Course),
+            [
+                {
+                    "course_name": f"Course {i}",
+                    "stream": "Science",
+                    "description": f"Semester plan {i}",
+                }
+                for i in range(ROWS)
+            ],
+        )
+        db.execute(
+            insert(Career),
+            [
+                {
+                    "career_name": f"Career {i}",
+                    "sector": "Public",
+                    "higher_study_options": ["M.Sc."],
+                    "exam_options": ["NET"],
+                }
+                for i in range(ROWS)
+            ],
+        )
+        db.execute(
+            insert(career_courses),
+            [
+                {"career_id": i + 1, "course_id": (i + k) % ROWS + 1}
+                for i in range(ROWS)
+                for k in range(3)
+            ],
+        )
+        db.commit()
+
+    def session():
+        with Session(engine) as db:
+            yield db
+
+    # Same wiring as main.py with QUERY_BUDGET_ENFORCE=true.
+    app = FastAPI()
+    app.middleware("http")(enforce_query_budget)
+    app.include_router(course.router, prefix="/v1/api/course")
+    app.include_router(career.router, prefix="/v1/api/career")
+    app.dependency_overrides[get_session] = session
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "path, budget",
+    [
+        ("/v1/api/course/", 2),
+        ("/v1/api/career/", 3),
+        ("/v1/api/career/?include=courses", 3),
+        ("/v1/api/career/2", 1),
+    ],
+)
+def test_catalog_reads_stay_within_budget(client, path, budget):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Query-Count"]) <= budget
+
+
+def test_career_list_includes_courses_in_one_query(client):
+    body = client.get("/v1/api/career/?include=courses").json()
+
+    assert len(body) == ROWS
+    assert all(len(career["courses"]) == 3 for career in body)
+
+
+def test_lazy_load_fails_the_budget(client, monkeypatch):
+    # Without the eager load, serializing the career lazy-loads its courses.
+    monkeypatch.setattr(crud_career, "load_options", lambda *args, **kwargs: ())
+
+    with pytest.raises(QueryBudgetExceeded, match="budget 1"):
+        client.get("/v1/api/career/2")
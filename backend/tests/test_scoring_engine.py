@@ -0,0 +1,94 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+import utils.scoring_engine as scoring_engine
+from utils.scoring_engine import compile_scoring_rules, recommend_streams
+from utils.scoring_rules import scoring_rules
+
+
+# The rule-by-rule scoring recommend_streams replaced.
+def reference_stream(rules: dict, user_answers: dict) -> str:
+    stream_scores = defaultdict(int)
+    for q_index, selected_option in user_answers.items():
+        score_map = rules.get(int(q_index), {}).get(int(selected_option), {})
+        for stream, score in score_map.items():
+            stream_scores[stream] += score
+    if not stream_scores:
+        return "Unknown"
+    return max(stream_scores, key=stream_scores.get)
+
+
+def use_rules(monkeypatch, rules: dict) -> None:
+    compiled = compile_scoring_rules(rules)
+    for name, value in zip(("STREAMS", "SCORES", "PRESENT", "RANKS"), compiled):
+        monkeypatch.setattr(scoring_engine, name, value)
+
+
+def test_matches_reference_on_shipped_rules():
+    rng = random.Random(0)
+    sheets = [
+        {
+            str(q): str(rng.randint(-1, 5))
+            for q in rng.sample(range(-1, 12), rng.randint(0, 10))
+        }
+        for _ in range(500)
+    ]
+
+    assert recommend_streams(sheets) == [
+        reference_stream(scoring_rules, sheet) for sheet in sheets
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_on_random_rules(monkeypatch, seed):
+    rng = random.Random(seed)
+    names = ["Science", "Commerce", "Arts", "Vocational", "Diploma"]
+    rules = {
+        q: {
+            o: {
+                stream: rng.choice([-1, 0, 1, 2])
+                for stream in rng.sample(names, rng.randint(1, 4))
+            }
+            for o in range(4)
+        }
+        for q in range(6)
+    }
+    sheets = [
+        {q: rng.randint(-1, 4) for q in rng.sample(range(7), rng.randint(0, 6))}
+        for _ in range(100)
+    ]
+    use_rules(monkeypatch, rules)
+
+    assert recommend_streams(sheets) == [
+        reference_stream(rules, sheet) for sheet in sheets
+    ]
+
+
+@pytest.mark.parametrize(
+    "sheet, expected",
+    [
+        # One option scoring two streams equally: score-map order decides.
+        ({0: 0}, "Arts"),
+        ({0: 1}, "Science"),
+        # Equal totals across answers: the stream touched first wins.
+        ({1: 0, 2: 0}, "Commerce"),
+        ({2: 0, 1: 0}, "Science"),
+        # A zero score still counts as the stream's first touch.
+        ({3: 0, 1: 0, 2: 0}, "Science"),
+        ({}, "Unknown"),
+        ({9: 0}, "Unknown"),
+    ],
+)
+def test_ties_go_to_the_first_stream_seen(monkeypatch, sheet, expected):
+    rules = {
+        0: {0: {"Arts": 2, "Science": 2}, 1: {"Science": 1, "Arts": 1}},
+        1: {0: {"Commerce": 1}},
+        2: {0: {"Science": 1}},
+        3: {0: {"Arts": 0, "Science": 0}},
+    }
+    use_rules(monkeypatch, rules)
+
+    assert reference_stream(rules, sheet) == expected
+    assert recommend_streams([sheet]) == [expected]
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+class Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "explanation"
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    async def scenario():
+        flights, upstream = SingleFlight(), Upstream()
+        first = asyncio.create_task(flights.do("key", upstream))
+        second = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return await asyncio.gather(first, second), upstream, flights
+
+    results, upstream, flights = asyncio.run(scenario())
+
+    assert results == ["explanation", "explanation"]
+    assert upstream.calls == 1
+    assert flights.shared == 1
+    assert len(flights) == 0
+
+
+def test_cancelling_one_waiter_leaves_the_other_running():
+    async def scenario():
+        flights, upstream = SingleFlight(), Upstream()
+        first = asyncio.create_task(flights.do("key", upstream))
+        second = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        upstream.release.set()
+        return await second, upstream
+
+    result, upstream = asyncio.run(scenario())
+
+    assert result == "explanation"
+    assert upstream.calls == 1
+    assert upstream.cancelled == 0
+
+
+def test_cancelling_the_last_waiter_cancels_the_upstream_call():
+    async def scenario():
+        flights, upstream = SingleFlight(), Upstream()
+        waiter = asyncio.create_task(flights.do("key", upstream))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+        return upstream, flights
+
+    upstream, flights = asyncio.run(scenario())
+
+    assert upstream.cancelled == 1
+    assert len(flights) == 0
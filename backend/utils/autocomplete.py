@@ -0,0 +1,200 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from heapq import merge
+from itertools import chain
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import select
+
+from core.config import settings
+from crud.hooks import on_write, row_value
+from db.database import SessionLocal
+from models.career import Career
+from models.college import College
+from models.course import Course
+from models.scholarship import Scholarship
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+class Entry(NamedTuple):
+    kind: str
+    label: str
+    ref_id: int | None
+    words: tuple[str, ...]
+
+
+def tokenize(value: str) -> tuple[str, ...]:
+    return tuple(_WORD.findall(value.lower()))
+
+
+class AutocompleteIndex:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: list[Entry] = []
+        self._keys: set[tuple[str, str, int | None]] = set()
+        # Sorted (word, entry position) pairs: every word prefix is one
+        # contiguous run, found with a single bisect.
+        self._pairs: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def _collect(
+        self,
+        items: Iterable[tuple[str, str | None, int | None]],
+        entries: list[Entry],
+        keys: set,
+    ) -> list[tuple[str, int]]:
+        pairs = []
+        for kind, label, ref_id in items:
+            if not label or len(entries) >= self.max_entries:
+                continue
+            label = label.strip()
+            key = (kind, label.lower(), ref_id)
+            if not label or key in keys:
+                continue
+            keys.add(key)
+            entry = Entry(kind, label, ref_id, tokenize(label))
+            pairs.extend((word, len(entries)) for word in set(entry.words))
+            # Entries are append-only: readers only follow postings from their
+            # own snapshot, which never point past the entries they can see.
+            entries.append(entry)
+        return pairs
+
+    def add(self, items: Iterable[tuple[str, str | None, int | None]]) -> None:
+        with self._lock:
+            pairs = self._collect(items, self._entries, self._keys)
+            if not pairs:
+                return
+            if len(pairs) <= settings.autocomplete_insort_limit:
+                # Each insert is a single atomic list operation; a concurrent
+                # lookup at worst sees one candidate shifted by a slot.
+                for pair in pairs:
+                    insort(self._pairs, pair)
+            else:
+                # Readers keep using the previous list until the swap.
+                self._pairs = list(merge(self._pairs, sorted(pairs)))
+
+    def rebuild(self, items: Iterable[tuple[str, str | None, int | None]]) -> None:
+        entries: list[Entry] = []
+        keys: set[tuple[str, str, int | None]] = set()
+        pairs = sorted(self._collect(items, entries, keys))
+        with self._lock:
+            self._entries, self._keys = entries, keys
+            self._pairs = pairs
+
+    def clear(self) -> None:
+        self.rebuild(())
+
+    def lookup(
+        self, query: str, kinds: set[str] | None = None, limit: int = 10
+    ) -> list[Entry]:
+        words = tokenize(query)
+        if not words:
+            return []
+        entries, pairs = self._entries, self._pairs
+        anchor = max(words, key=len)
+        others = list(words)
+        others.remove(anchor)
+        normalized = " ".join(words)
+
+        matches: dict[int, Entry] = {}
+        position = bisect_left(pairs, (anchor,))
+        scanned = 0
+        while (
+            position < len(pairs)
+            and pairs[position][0].startswith(anchor)
+            and scanned < limit * settings.autocomplete_scan_factor
+        ):
+            entry_position = pairs[position][1]
+            entry = entries[entry_position]
+            position += 1
+            scanned += 1
+            if kinds and entry.kind not in kinds:
+                continue
+            if all(any(w.startswith(o) for w in entry.words) for o in others):
+                matches[entry_position] = entry
+
+        ranked = sorted(
+            matches.values(),
+            key=lambda e: (
+                not " ".join(e.words).startswith(normalized),
+                len(e.label),
+                e.label,
+            ),
+        )
+        return ranked[:limit]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+autocomplete_index = AutocompleteIndex(settings.autocomplete_max_entries)
+
+
+def _college_entries(
+    colleges: Iterable,
+) -> Iterable[tuple[str, str | None, int | None]]:
+    for college in colleges:
+        college_id = row_value(college, "college_id")
+        yield "college", row_value(college, "college_name"), college_id
+        for key in ("location", "district", "state"):
+            yield "location", row_value(college, key), None
+        for degree in row_value(college, "degrees") or []:
+            yield "degree", row_value(degree, "degree_name"), None
+
+
+def _scholarship_entries(rows: Iterable) -> Iterable:
+    for row in rows:
+        yield (
+            "scholarship",
+            row_value(row, "scholarship_name"),
+            row_value(row, "scholarship_id"),
+        )
+
+
+def _course_entries(rows: Iterable) -> Iterable:
+    for row in rows:
+        yield "course", row_value(row, "course_name"), row_value(row, "course_id")
+
+
+def _career_entries(rows: Iterable) -> Iterable:
+    for row in rows:
+        yield "career", row_value(row, "career_name"), row_value(row, "career_id")
+
+
+@on_write("colleges")
+def _index_colleges(rows: list) -> None:
+    autocomplete_index.add(_college_entries(rows))
+
+
+@on_write("scholarships")
+def _index_scholarships(rows: list) -> None:
+    autocomplete_index.add(_scholarship_entries(rows))
+
+
+@on_write("courses")
+def _index_courses(rows: list) -> None:
+    autocomplete_index.add(_course_entries(rows))
+
+
+@on_write("careers")
+def _index_careers(rows: list) -> None:
+    autocomplete_index.add(_career_entries(rows))
+
+
+def build_autocomplete_index() -> int:
+    with SessionLocal() as db:
+        # One sort over everything instead of merging table by table.
+        autocomplete_index.rebuild(
+            chain.from_iterable(
+                entries(db.execute(select(*model.__table__.columns)).mappings())
+                for model, entries in (
+                    (College, _college_entries),
+                    (Scholarship, _scholarship_entries),
+                    (Course, _course_entries),
+                    (Career, _career_entries),
+                )
+            )
+        )
+    return len(autocomplete_index)
@@ -0,0 +1,185 @@
+import asyncio
+import uuid
+
+from core.config import settings
+from models.job import Job
+from utils.explanation_cache import cache_key
+from utils.gemini import PROMPT_VERSION, explain_recommendation
+from utils.ttl_cache import TTLCache
+
+BULK_EXPLANATIONS = "bulk_explanations"
+JOB_STATUSES = {
+    "queued": "pending",
+    "running": "running",
+    "succeeded": "completed",
+    "failed": "failed",
+}
+
+
+def dedupe_prompts(
+    answer_sheets: list[dict], recommended_streams: list[str]
+) -> tuple[dict[str, tuple[dict, str]], list[str]]:
+    # Sheets with the same prompt share one explanation.
+    prompts: dict[str, tuple[dict, str]] = {}
+    sheet_keys: list[str] = []
+    for answers, stream in zip(answer_sheets, recommended_streams):
+        key = cache_key(answers, stream, PROMPT_VERSION, settings.gemini_model)
+        prompts.setdefault(key, (answers, stream))
+        sheet_keys.append(key)
+    return prompts, sheet_keys
+
+
+async def explain_prompts(
+    prompts: dict[str, tuple[dict, str]],
+    explanations: dict[str, str],
+    errors: dict[str, str],
+) -> None:
+    slots = asyncio.Semaphore(settings.bulk_explanation_concurrency)
+
+    async def explain(key: str, answers: dict, stream: str) -> None:
+        async with slots:
+            try:
+                explanations[key] = await explain_recommendation(answers, stream)
+            except Exception as e:
+                errors[key] = str(e) or type(e).__name__
+
+    await asyncio.gather(*(explain(key, *prompt) for key, prompt in prompts.items()))
+
+
+def build_page(
+    job_id: str,
+    status: str,
+    recommended_streams: list[str],
+    sheet_keys: list[str],
+    explanations: dict[str, str],
+    errors: dict[str, str],
+    offset: int,
+    limit: int,
+) -> dict:
+    results = []
+    for index in range(offset, min(offset + limit, len(sheet_keys))):
+        key = sheet_keys[index]
+        results.append(
+            {
+                "index": index,
+                "recommended_stream": recommended_streams[index],
+                "ai_reasoning": explanations.get(key),
+                "error": errors.get(key),
+            }
+        )
+    return {
+        "job_id": job_id,
+        "status": status,
+        "total": len(sheet_keys),
+        "unique_prompts": len(set(sheet_keys)),
+        "completed_prompts": len(explanations) + len(errors),
+        "offset": offset,
+        "limit": limit,
+        "results": results,
+    }
+
+
+class BulkJob:
+    def __init__(self, answer_sheets: list[dict], recommended_streams: list[str]):
+        self.job_id = uuid.uuid4().hex
+        self.recommended_streams = recommended_streams
+        self.status = "pending"
+        self.prompts, self.sheet_keys = dedupe_prompts(
+            answer_sheets, recommended_streams
+        )
+        self.explanations: dict[str, str] = {}
+        self.errors: dict[str, str] = {}
+        self.task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        self.status = "running"
+        try:
+            await explain_prompts(self.prompts, self.explanations, self.errors)
+            self.status = "completed"
+        finally:
+            bulk_jobs.finish(self)
+
+    def page(self, offset: int, limit: int) -> dict:
+        return build_page(
+            self.job_id,
+            self.status,
+            self.recommended_streams,
+            self.sheet_keys,
+            self.explanations,
+            self.errors,
+            offset,
+            limit,
+        )
+
+
+class BulkJobStore:
+    # Jobs still running are never evicted, so a poller cannot lose a job that
+    # is still spending tokens; retention and TTL apply once a job finishes.
+    def __init__(self, retention: int, ttl: float):
+        self._active: dict[str, BulkJob] = {}
+        self._finished = TTLCache(maxsize=retention, ttl=ttl)
+
+    def add(self, job: BulkJob) -> None:
+        self._active[job.job_id] = job
+
+    def finish(self, job: BulkJob) -> None:
+        self._finished.set(job.job_id, job)
+        self._active.pop(job.job_id, None)
+
+    def get(self, job_id: str) -> BulkJob | None:
+        return self._active.get(job_id) or self._finished.get(job_id)
+
+
+bulk_jobs = BulkJobStore(settings.bulk_job_retention, settings.bulk_job_ttl_seconds)
+
+
+def start_bulk_job(
+    answer_sheets: list[dict], recommended_streams: list[str]
+) -> BulkJob:
+    job = BulkJob(answer_sheets, recommended_streams)
+    bulk_jobs.add(job)
+    job.task = asyncio.create_task(job.run())
+    return job
+
+
+def bulk_job_payload(answer_sheets: list[dict], recommended_streams: list[str]) -> dict:
+    return {
+        "answer_sheets": answer_sheets,
+        "recommended_streams": recommended_streams,
+        "sheet_keys": dedupe_prompts(answer_sheets, recommended_streams)[1],
+    }
+
+
+class BulkExplanationError(RuntimeError):
+    pass
+
+
+async def run_bulk_explanations(payload: dict) -> dict:
+    prompts, _ = dedupe_prompts(
+        payload["answer_sheets"], payload["recommended_streams"]
+    )
+    explanations: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    await explain_prompts(prompts, explanations, errors)
+    # Raising hands the job back to the queue for a retry with backoff;
+    # explanations that did succeed are in the explanation cache by then.
+    if prompts and len(errors) / len(prompts) >= settings.bulk_job_failure_ratio:
+        raise BulkExplanationError(
+            f"{len(errors)} of {len(prompts)} explanations failed, e.g. "
+            f"{next(iter(errors.values()))}"
+        )
+    return {"explanations": explanations, "errors": errors}
+
+
+def queued_bulk_page(job: Job, offset: int, limit: int) -> dict:
+    result = job.result or {}
+    return build_page(
+        str(job.job_id),
+        JOB_STATUSES.get(str(job.status), str(job.status)),
+        job.payload["recommended_streams"],
+        job.payload["sheet_keys"],
+        result.get("explanations", {}),
+        result.get("errors", {}),
+        offset,
+        limit,
+    )
@@ -0,0 +1,215 @@
+import threading
+from collections import deque
+from typing import Callable, Iterable
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud.hooks import on_write
+from db.database import SessionLocal
+from mock_data import roadmaps
+from models.career import Career
+from models.career_course import career_courses
+from models.course import Course
+from utils.roadmaps import normalize_key
+from utils.ttl_cache import TTLCache
+
+NODE_KINDS = ("stream", "field", "course", "career")
+
+
+def _csr(
+    sources: np.ndarray, targets: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(sources, kind="stable")
+    offsets = np.zeros(size + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources, minlength=size), out=offsets[1:])
+    return offsets, targets[order].astype(np.int32)
+
+
+class CourseGraph:
+    def __init__(self, nodes: list[tuple[str, str]], edges: Iterable[tuple[int, int]]):
+        self.nodes = nodes
+        self.lookup = {
+            (kind, normalize_key(label)): node
+            for node, (kind, label) in enumerate(nodes)
+        }
+        pairs = np.array(sorted(set(edges)), dtype=np.int32).reshape(-1, 2)
+        self.edge_count = len(pairs)
+        # Compressed sparse rows: out-edges of node n are
+        # targets[offsets[n]:offsets[n + 1]]; the reverse arrays hold in-edges.
+        self.offsets, self.targets = _csr(pairs[:, 0], pairs[:, 1], len(nodes))
+        self.reverse_offsets, self.reverse_targets = _csr(
+            pairs[:, 1], pairs[:, 0], len(nodes)
+        )
+
+    def find(self, kind: str, label: str) -> int | None:
+        return self.lookup.get((kind, normalize_key(label)))
+
+    def find_prefix(self, kind: str, label: str) -> list[int]:
+        # "Science" should also match roadmap streams like "Science (PCM)".
+        key = normalize_key(label)
+        return [
+            node
+            for (node_kind, node_key), node in self.lookup.items()
+            if node_kind == kind and (node_key == key or node_key.startswith(key + " "))
+        ]
+
+    def successors(self, node: int) -> list[int]:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]].tolist()
+
+    def predecessors(self, node: int) -> list[int]:
+        return self.reverse_targets[
+            self.reverse_offsets[node] : self.reverse_offsets[node + 1]
+        ].tolist()
+
+    def _bfs(
+        self,
+        starts: list[int],
+        expand: Callable[[int], list[int]],
+        max_depth: int | None = None,
+        goal: int | None = None,
+    ) -> dict[int, tuple[int, int | None]]:
+        seen: dict[int, tuple[int, int | None]] = {node: (0, None) for node in starts}
+        queue = deque(starts)
+        while queue:
+            node = queue.popleft()
+            if node == goal:
+                break
+            depth = seen[node][0]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbour in expand(node):
+                if neighbour not in seen:
+                    seen[neighbour] = (depth + 1, node)
+                    queue.append(neighbour)
+        return seen
+
+    def shortest_path(self, starts: list[int], goal: int) -> list[int] | None:
+        seen = self._bfs(starts, self.successors, goal=goal)
+        if goal not in seen:
+            return None
+        path = [goal]
+        while (parent := seen[path[-1]][1]) is not None:
+            path.append(parent)
+        return path[::-1]
+
+    def reachable(self, start: int, kind: str) -> list[tuple[int, int]]:
+        seen = self._bfs([start], self.successors)
+        return sorted(
+            (depth, node)
+            for node, (depth, _) in seen.items()
+            if node != start and self.nodes[node][0] == kind
+        )
+
+    def neighbourhood(self, start: int, hops: int) -> list[tuple[int, int]]:
+        seen = self._bfs(
+            [start],
+            lambda node: self.successors(node) + self.predecessors(node),
+            max_depth=hops,
+        )
+        return sorted((depth, node) for node, (depth, _) in seen.items())
+
+
+class _GraphBuilder:
+    def __init__(self):
+        self.nodes: list[tuple[str, str]] = []
+        self.ids: dict[tuple[str, str], int] = {}
+        self.edges: list[tuple[int, int]] = []
+
+    def node(self, kind: str, label: str | None) -> int | None:
+        key = (kind, normalize_key(label or ""))
+        if not key[1]:
+            return None
+        if key not in self.ids:
+            self.ids[key] = len(self.nodes)
+            self.nodes.append((kind, label.strip()))
+        return self.ids[key]
+
+    def edge(self, source: int | None, target: int | None) -> None:
+        if source is not None and target is not None and source != target:
+            self.edges.append((source, target))
+
+
+def build_course_graph(db: Session) -> CourseGraph:
+    builder = _GraphBuilder()
+    for roadmap in roadmaps:
+        field = builder.node("field", roadmap.get("careerField"))
+        stream = builder.node(
+            "stream", (roadmap.get("after10th") or {}).get("recommendedStream")
+        )
+        builder.edge(stream, field)
+        for course_key, details in (roadmap.get("courses") or {}).items():
+            course = builder.node("course", details.get("name") or course_key)
+            builder.edge(field, course)
+            builder.edge(stream, course)
+            paths = details.get("careerPaths") or {}
+            for role in paths.get("jobRoles") or []:
+                builder.edge(course, builder.node("career", role))
+            for next_course in paths.get("higherEducation") or []:
+                builder.edge(course, builder.node("course", next_course))
+
+    courses = {}
+    for course_id, course_name, stream in db.execute(
+        select(Course.course_id, Course.course_name, Course.stream)
+    ):
+        courses[course_id] = builder.node("course", course_name)
+        builder.edge(builder.node("stream", stream), courses[course_id])
+    careers = {
+        career_id: builder.node("career", career_name)
+        for career_id, career_name in db.execute(
+            select(Career.career_id, Career.career_name)
+        )
+    }
+    for career_id, course_id in db.execute(
+        select(career_courses.c.career_id, career_courses.c.course_id)
+    ):
+        builder.edge(courses.get(course_id), careers.get(career_id))
+    return CourseGraph(builder.nodes, builder.edges)
+
+
+class CourseGraphEngine:
+    def __init__(self):
+        self.version = 0
+        self.cache = TTLCache(
+            settings.graph_cache_size, settings.graph_cache_ttl_seconds
+        )
+        self._graph: CourseGraph | None = None
+        self._graph_version = -1
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        # Bumping the version retires every cached answer at once, even one
+        # computed concurrently against the old graph.
+        with self._lock:
+            self.version += 1
+        self.cache.clear()
+
+    def graph(self) -> tuple[int, CourseGraph]:
+        with self._lock:
+            version = self.version
+            if self._graph is None or self._graph_version != version:
+                with SessionLocal() as db:
+                    self._graph = build_course_graph(db)
+                self._graph_version = version
+            return version, self._graph
+
+    def query(self, name: str, args: tuple, compute: Callable[[CourseGraph], object]):
+        version, graph = self.graph()
+        key = (version, name, args)
+        result = self.cache.get(key)
+        if result is None:
+            result = compute(graph)
+            self.cache.set(key, result)
+        return result
+
+
+course_graph = CourseGraphEngine()
+
+
+@on_write("career_courses")
+@on_write("courses")
+@on_write("careers")
+def _invalidate_graph(rows: list) -> None:
+    course_graph.invalidate()
@@ -0,0 +1,93 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+
+from fastapi.concurrency import run_in_threadpool
+
+from core.config import settings
+from db.database import SessionLocal
+from models.explanation_cache import ExplanationCacheEntry
+from utils.ttl_cache import TTLCache
+
+
+def normalize_answers(user_answers: dict) -> list[tuple[int, int]]:
+    return sorted((int(q), int(option)) for q, option in user_answers.items())
+
+
+def cache_key(
+    user_answers: dict, recommended_stream: str, prompt_version: str, model: str
+) -> str:
+    payload = json.dumps(
+        [normalize_answers(user_answers), recommended_stream, prompt_version, model],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DatabaseCacheTier:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        with SessionLocal() as db:
+            entry = db.get(ExplanationCacheEntry, key)
+            oldest = datetime.now(timezone.utc) - timedelta(seconds=self.ttl)
+            if entry is None or entry.created_at.replace(tzinfo=timezone.utc) < oldest:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return str(entry.explanation)
+
+    def set(self, key: str, explanation: str) -> None:
+        with SessionLocal() as db:
+            db.merge(
+                ExplanationCacheEntry(
+                    cache_key=key,
+                    explanation=explanation,
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            db.commit()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class ExplanationCache:
+    def __init__(self, memory: TTLCache, shared: DatabaseCacheTier | None = None):
+        self.memory = memory
+        self.shared = shared
+
+    async def get(self, key: str) -> str | None:
+        explanation = self.memory.get(key)
+        if explanation is None and self.shared is not None:
+            explanation = await run_in_threadpool(self.shared.get, key)
+            if explanation is not None:
+                self.memory.set(key, explanation)
+        return explanation
+
+    async def set(self, key: str, explanation: str) -> None:
+        self.memory.set(key, explanation)
+        if self.shared is not None:
+            await run_in_threadpool(self.shared.set, key, explanation)
+
+    def stats(self) -> dict:
+        return {
+            "memory": self.memory.stats(),
+            "shared": self.shared.stats() if self.shared is not None else None,
+        }
+
+
+explanation_cache = ExplanationCache(
+    TTLCache(
+        maxsize=settings.explanation_cache_size,
+        ttl=settings.explanation_cache_ttl_seconds,
+    ),
+    (
+        DatabaseCacheTier(ttl=settings.explanation_cache_ttl_seconds)
+        if settings.explanation_cache_shared
+        else None
+    ),
+)
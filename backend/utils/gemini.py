@@ -1,13 +1,21 @@
-from collections import defaultdict
+import asyncio
+from typing import AsyncIterator
 
 from google import genai
 from google.genai import types
 
 from core.config import settings
 from mock_data import QUESTION_SET
-from utils.scoring_rules import scoring_rules
+from utils.explanation_cache import cache_key, explanation_cache
+from utils.scoring_engine import recommend_stream
+from utils.single_flight import SingleFlight
 
 client = genai.Client(api_key=settings.gemini_api_key)
+generation_slots = asyncio.Semaphore(settings.gemini_max_concurrency)
+explanation_flights = SingleFlight()
+
+# Bump whenever build_system_prompt changes so cached explanations are not reused.
+PROMPT_VERSION = "1"
 
 
 def build_system_prompt(user_answers: dict, recommended_stream: str) -> str:
@@ -40,35 +48,92 @@ Keep the explanation concise (under 200 words) and easy to understand by a stude
     return prompt
 
 
-def recommend_stream(user_answers: dict) -> str:
-    stream_scores = defaultdict(int)
-
-    for q_index, selected_option in user_answers.items():
-        q_index = int(q_index)
-        selected_option = int(selected_option)
-
-        score_map = scoring_rules.get(q_index, {}).get(selected_option, {})
+async def generate_explanation(system_prompt: str) -> str:
+    async with generation_slots:
+        response = await asyncio.wait_for(
+            client.aio.models.generate_content(
+                model=settings.gemini_model,
+                contents=system_prompt,
+                config=types.GenerateContentConfig(
+                    # Disables thinking
+                    thinking_config=types.ThinkingConfig(thinking_budget=0)
+                ),
+            ),
+            timeout=settings.gemini_timeout_seconds,
+        )
+    return response.candidates[0].content.parts[0].text.strip()  # type: ignore
+
+
+async def stream_explanation(system_prompt: str) -> AsyncIterator[str]:
+    async with generation_slots:
+        chunks = await asyncio.wait_for(
+            client.aio.models.generate_content_stream(
+                model=settings.gemini_model,
+                contents=system_prompt,
+                config=types.GenerateContentConfig(
+                    # Disables thinking
+                    thinking_config=types.ThinkingConfig(thinking_budget=0)
+                ),
+            ),
+            timeout=settings.gemini_timeout_seconds,
+        )
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    anext(chunks), timeout=settings.gemini_timeout_seconds
+                )
+            except StopAsyncIteration:
+                break
+            if chunk.text:
+                yield chunk.text
+
+
+async def _generate_and_cache(key: str, system_prompt: str) -> str:
+    explanation = await generate_explanation(system_prompt)
+    await explanation_cache.set(key, explanation)
+    return explanation
+
+
+async def explain_recommendation(user_answers: dict, recommended_stream: str) -> str:
+    key = cache_key(
+        user_answers, recommended_stream, PROMPT_VERSION, settings.gemini_model
+    )
+    explanation = await explanation_cache.get(key)
+    if explanation is None:
+        system_prompt = build_system_prompt(user_answers, recommended_stream)
+        explanation = await explanation_flights.do(
+            key, lambda: _generate_and_cache(key, system_prompt)
+        )
+    return explanation
 
-        for stream, score in score_map.items():
-            stream_scores[stream] += score
 
-    if not stream_scores:
-        return "Unknown"
+async def generate_career_explanation(user_answers: dict):
+    recommended_stream = recommend_stream(user_answers)
+    explanation = await explain_recommendation(user_answers, recommended_stream)
+    return recommended_stream, explanation
 
-    recommended_stream = max(stream_scores, key=stream_scores.get)  # type: ignore
-    return recommended_stream
 
+async def stream_career_explanation(
+    user_answers: dict, recommended_stream: str
+) -> AsyncIterator[str]:
+    key = cache_key(
+        user_answers, recommended_stream, PROMPT_VERSION, settings.gemini_model
+    )
+    explanation = await explanation_cache.get(key)
+    if explanation is not None:
+        yield explanation
+        return
 
-def generate_career_explanation(user_answers: dict):
-    recommended_stream = recommend_stream(user_answers)
+    parts = []
     system_prompt = build_system_prompt(user_answers, recommended_stream)
+    async for text in stream_explanation(system_prompt):
+        parts.append(text)
+        yield text
+    await explanation_cache.set(key, "".join(parts).strip())
+
 
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=system_prompt,
-        config=types.GenerateContentConfig(
-            thinking_config=types.ThinkingConfig(thinking_budget=0)  # Disables thinking
-        ),
+async def warm_explanation_cache(answer_sets: list[dict]) -> int:
+    results = await asyncio.gather(
+        *(generate_career_explanation(answers) for answers in answer_sets)
     )
-    explanation = response.candidates[0].content.parts[0].text.strip()  # type: ignore
-    return recommended_stream, explanation
+    return len(results)
@@ -0,0 +1,194 @@
+import csv
+import math
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from sqlalchemy import select
+
+from core.config import settings
+from crud.hooks import on_write, row_value
+from db.database import SessionLocal
+from models.college import College
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+Point = tuple[float, float]
+
+
+def _normalize(value: str | None) -> str:
+    return " ".join((value or "").lower().split())
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer() -> dict[tuple[str, str], Point]:
+    path = Path(settings.gazetteer_path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parent.parent / path
+    places: dict[tuple[str, str], Point] = {}
+    with path.open(newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            point = (float(row["latitude"]), float(row["longitude"]))
+            state = _normalize(row["state"])
+            for name in (row["name"], row["district"]):
+                # Exact city rows win over a district centroid of the same name.
+                places.setdefault((_normalize(name), state), point)
+                places.setdefault((_normalize(name), ""), point)
+    return places
+
+
+def geocode(*names: str | None, state: str | None = None) -> Point | None:
+    places = load_gazetteer()
+    state = _normalize(state)
+    for name in names:
+        name = _normalize(name)
+        if not name:
+            continue
+        point = places.get((name, state)) or places.get((name, ""))
+        if point:
+            return point
+    return None
+
+
+def haversine_km(a: Point, b: Point) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def _ring_cells(row: int, col: int, ring: int):
+    if ring == 0:
+        yield (row, col)
+        return
+    for c in range(col - ring, col + ring + 1):
+        yield (row - ring, c)
+        yield (row + ring, c)
+    for r in range(row - ring + 1, row + ring):
+        yield (r, col - ring)
+        yield (r, col + ring)
+
+
+class GeoIndex:
+    def __init__(self, cell_degrees: float):
+        self.cell_degrees = cell_degrees
+        self._cells: dict[tuple[int, int], dict[int, Point]] = {}
+        self._points: dict[int, tuple[int, int]] = {}
+        self._bounds: tuple[int, int, int, int] | None = None
+        self._lock = threading.Lock()
+
+    def _cell(self, point: Point) -> tuple[int, int]:
+        return (
+            math.floor(point[0] / self.cell_degrees),
+            math.floor(point[1] / self.cell_degrees),
+        )
+
+    def add(self, items) -> None:
+        with self._lock:
+            # Copy-on-write per touched cell so lock-free readers never see a
+            # bucket change size mid-iteration.
+            buckets: dict[tuple[int, int], dict[int, Point]] = {}
+
+            def bucket(cell: tuple[int, int]) -> dict[int, Point]:
+                if cell not in buckets:
+                    buckets[cell] = dict(self._cells.get(cell, {}))
+                return buckets[cell]
+
+            for ref_id, point in items:
+                old = self._points.get(ref_id)
+                if old is not None:
+                    bucket(old).pop(ref_id, None)
+                cell = self._cell(point)
+                bucket(cell)[ref_id] = point
+                self._points[ref_id] = cell
+            if not buckets:
+                return
+            self._cells.update(buckets)
+            rows = [cell[0] for cell in buckets]
+            cols = [cell[1] for cell in buckets]
+            if self._bounds is not None:
+                rows += self._bounds[0::2]
+                cols += self._bounds[1::2]
+            self._bounds = (min(rows), min(cols), max(rows), max(cols))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cells, self._points, self._bounds = {}, {}, None
+
+    def _ring_floor_km(self, ring: int, latitude: float) -> float:
+        # Lower bound on the distance to any cell `ring` steps away: longitude
+        # cells shrink towards the poles, so use the widest latitude reached.
+        if ring <= 0:
+            return 0.0
+        span = (ring - 1) * self.cell_degrees
+        widest = min(90.0, abs(latitude) + (ring + 1) * self.cell_degrees)
+        return span * KM_PER_DEGREE * math.cos(math.radians(widest))
+
+    def nearest(
+        self, origin: Point, limit: int, radius_km: float | None = None
+    ) -> list[tuple[int, float]]:
+        cells, bounds = self._cells, self._bounds
+        if bounds is None:
+            return []
+        row, col = self._cell(origin)
+        low_row, low_col, high_row, high_col = bounds
+        max_ring = max(
+            abs(low_row - row),
+            abs(high_row - row),
+            abs(low_col - col),
+            abs(high_col - col),
+        )
+        found: list[tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            floor_km = self._ring_floor_km(ring, origin[0])
+            if radius_km is not None and floor_km > radius_km:
+                break
+            found.sort()
+            if len(found) >= limit and found[limit - 1][0] <= floor_km:
+                break
+            for cell in _ring_cells(row, col, ring):
+                for ref_id, point in cells.get(cell, {}).items():
+                    distance = haversine_km(origin, point)
+                    if radius_km is None or distance <= radius_km:
+                        found.append((distance, ref_id))
+        found.sort()
+        return [(ref_id, distance) for distance, ref_id in found[:limit]]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+
+geo_index = GeoIndex(settings.geo_cell_degrees)
+
+
+def college_point(college) -> Point | None:
+    latitude = row_value(college, "latitude")
+    longitude = row_value(college, "longitude")
+    if latitude is None or longitude is None:
+        return None
+    return (latitude, longitude)
+
+
+@on_write("colleges")
+def _index_colleges(rows: list) -> None:
+    geo_index.add(
+        (row_value(row, "college_id"), point)
+        for row in rows
+        if (point := college_point(row)) is not None
+    )
+
+
+def build_geo_index() -> int:
+    geo_index.clear()
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(College.college_id, College.latitude, College.longitude).where(
+                College.latitude.is_not(None), College.longitude.is_not(None)
+            )
+        ).mappings()
+        for chunk in rows.partitions(settings.export_chunk_size):
+            _index_colleges(list(chunk))
+    return len(geo_index)
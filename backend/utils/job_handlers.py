@@ -0,0 +1,7 @@
+from typing import Awaitable, Callable
+
+from utils.bulk_jobs import BULK_EXPLANATIONS, run_bulk_explanations
+
+JOB_HANDLERS: dict[str, Callable[[dict], Awaitable[dict | list | None]]] = {
+    BULK_EXPLANATIONS: run_bulk_explanations,
+}
@@ -0,0 +1,67 @@
+import hashlib
+import json
+import re
+from difflib import get_close_matches
+from functools import lru_cache
+
+from core.config import settings
+from mock_data import roadmaps
+
+_SEPARATORS = re.compile(r"\s*(?:&|,|/|\band\b|\s-\s)\s*")
+_NON_WORD = re.compile(r"[^a-z0-9+]+")
+
+
+def normalize_key(value: str) -> str:
+    return _NON_WORD.sub(" ", value.lower().replace("&", " and ")).strip()
+
+
+def _encode(roadmap: dict) -> bytes:
+    # Same encoding as FastAPI's JSONResponse, done once per roadmap.
+    return json.dumps(
+        roadmap, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class RoadmapRegistry:
+    def __init__(self, entries: list[dict]):
+        self.fields = [entry.get("careerField", "") for entry in entries]
+        self.payloads = [_encode(entry) for entry in entries]
+        self.etags = [
+            f'"{hashlib.sha256(payload).hexdigest()[:32]}"' for payload in self.payloads
+        ]
+        self.keys: dict[str, int] = {}
+        aliases: dict[str, set[int]] = {}
+        for position, entry in enumerate(entries):
+            field = self.fields[position]
+            self.keys.setdefault(normalize_key(field), position)
+            names = [*_SEPARATORS.split(field)]
+            for course_key, course in (entry.get("courses") or {}).items():
+                names.extend([course_key, course.get("name", "")])
+            for name in names:
+                key = normalize_key(name)
+                if key:
+                    aliases.setdefault(key, set()).add(position)
+        # An alias shared by several fields ("Science") is ambiguous; drop it.
+        for key, positions in aliases.items():
+            if len(positions) == 1:
+                self.keys.setdefault(key, next(iter(positions)))
+        self._candidates = list(self.keys)
+
+    @lru_cache(maxsize=4096)
+    def resolve(self, career_field: str) -> int | None:
+        key = normalize_key(career_field)
+        if key in self.keys:
+            return self.keys[key]
+        matches = get_close_matches(
+            key, self._candidates, n=1, cutoff=settings.roadmap_fuzzy_cutoff
+        )
+        return self.keys[matches[0]] if matches else None
+
+    def payload(self, career_field: str) -> tuple[str, bytes, str] | None:
+        position = self.resolve(career_field)
+        if position is None:
+            return None
+        return self.fields[position], self.payloads[position], self.etags[position]
+
+
+roadmap_registry = RoadmapRegistry(roadmaps)
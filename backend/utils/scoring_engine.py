@@ -0,0 +1,130 @@
+from itertools import chain
+
+import numpy as np
+
+from utils.scoring_rules import scoring_rules
+
+UNKNOWN_STREAM = "Unknown"
+
+
+def compile_scoring_rules(
+    rules: dict,
+) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    streams: list[str] = []
+    for options in rules.values():
+        for score_map in options.values():
+            for stream in score_map:
+                if stream not in streams:
+                    streams.append(stream)
+
+    shape = (
+        max(rules, default=-1) + 1,
+        max((max(options, default=-1) for options in rules.values()), default=-1) + 1,
+        len(streams),
+    )
+    values = [
+        score
+        for options in rules.values()
+        for score_map in options.values()
+        for score in score_map.values()
+    ]
+    dtype = np.int64 if all(isinstance(v, int) for v in values) else np.float64
+
+    # scores[q, o, s] is the points option o of question q gives stream s;
+    # present marks entries that exist in the rules even with a score of 0;
+    # ranks is each stream's position within its option's score map.
+    scores = np.zeros(shape, dtype=dtype)
+    present = np.zeros(shape, dtype=bool)
+    ranks = np.zeros(shape, dtype=np.int64)
+    for q_index, options in rules.items():
+        for option, score_map in options.items():
+            for rank, (stream, score) in enumerate(score_map.items()):
+                scores[q_index, option, streams.index(stream)] = score
+                present[q_index, option, streams.index(stream)] = True
+                ranks[q_index, option, streams.index(stream)] = rank
+    return streams, scores, present, ranks
+
+
+STREAMS, SCORES, PRESENT, RANKS = compile_scoring_rules(scoring_rules)
+
+
+def _index_array(values: list[int], bound: int) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        # Anything outside int64 is out of range anyway; clamp so it is masked.
+        return np.asarray([min(max(v, -1), bound) for v in values], dtype=np.int64)
+
+
+def recommend_streams(answer_sheets: list[dict]) -> list[str]:
+    question_count, option_count, stream_count = SCORES.shape
+    counts = np.fromiter(
+        (len(answers) for answers in answer_sheets),
+        dtype=np.int64,
+        count=len(answer_sheets),
+    )
+    questions = _index_array(
+        list(map(int, chain.from_iterable(answer_sheets))), question_count
+    )
+    options = _index_array(
+        list(
+            map(int, chain.from_iterable(answers.values() for answers in answer_sheets))
+        ),
+        option_count,
+    )
+
+    sheet_count = len(answer_sheets)
+    rows = np.repeat(np.arange(sheet_count), counts)
+    positions = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    valid = (
+        (questions >= 0)
+        & (questions < question_count)
+        & (options >= 0)
+        & (options < option_count)
+    )
+    rows, positions = rows[valid], positions[valid]
+    questions, options = questions[valid], options[valid]
+
+    # Flatten (sheet, stream) into one axis so the sums are a single bincount
+    # and first appearances are the first occurrence of each flat index.
+    cells = (rows[:, None] * stream_count + np.arange(stream_count)).ravel()
+    totals = (
+        np.bincount(
+            cells,
+            weights=SCORES[questions, options].ravel(),
+            minlength=sheet_count * stream_count,
+        )
+        .astype(SCORES.dtype)
+        .reshape(sheet_count, stream_count)
+    )
+    never = np.iinfo(np.int64).max
+    first_seen = np.full(sheet_count * stream_count, never, dtype=np.int64)
+    present = PRESENT[questions, options].ravel()
+    # Insertion order: answer position first, then the stream's place in that
+    # option's score map.
+    order = (
+        np.repeat(positions, stream_count) * stream_count
+        + RANKS[questions, options].ravel()
+    )
+    present_cells, first = np.unique(cells[present], return_index=True)
+    first_seen[present_cells] = order[present][first]
+    first_seen = first_seen.reshape(sheet_count, stream_count)
+
+    # Matches max() over an insertion-ordered dict: among the top-scoring
+    # streams, the one whose score was touched first by the answers wins.
+    seen = first_seen != never
+    if np.issubdtype(totals.dtype, np.integer):
+        lowest = np.iinfo(totals.dtype).min
+    else:
+        lowest = -np.inf
+    best = np.where(seen, totals, lowest).max(axis=1, initial=lowest)
+    candidates = seen & (totals == best[:, None])
+    winners = np.where(candidates, first_seen, never).argmin(axis=1)
+    return [
+        STREAMS[winner] if has_score else UNKNOWN_STREAM
+        for winner, has_score in zip(winners.tolist(), seen.any(axis=1).tolist())
+    ]
+
+
+def recommend_stream(user_answers: dict) -> str:
+    return recommend_streams([user_answers])[0]
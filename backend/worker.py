@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import os
+import socket
+
+from core.config import settings
+from db import jobs
+from db.database import Base, SessionLocal, engine
+from utils.job_handlers import JOB_HANDLERS
+
+logger = logging.getLogger("worker")
+
+
+def _claim(worker_id: str):
+    with SessionLocal() as db:
+        return jobs.claim(db, worker_id)
+
+
+def _heartbeat(job_id: int, worker_id: str) -> bool:
+    with SessionLocal() as db:
+        return jobs.heartbeat(db, job_id, worker_id)
+
+
+def _complete(job_id: int, worker_id: str, result) -> None:
+    with SessionLocal() as db:
+        if not jobs.complete(db, job_id, worker_id, result):
+            logger.warning(
+                "%s lost the lock on job %s; result dropped", worker_id, job_id
+            )
+
+
+def _fail(job_id: int, worker_id: str, error: str) -> None:
+    with SessionLocal() as db:
+        if not jobs.fail(db, job_id, worker_id, error):
+            logger.warning(
+                "%s lost the lock on job %s; error dropped", worker_id, job_id
+            )
+
+
+async def _run(job):
+    handler = JOB_HANDLERS[str(job.kind)]
+    return await handler(dict(job.payload))  # type: ignore
+
+
+async def _hold_lock(job_id: int, worker_id: str, task: asyncio.Task) -> None:
+    # Renew well inside the lock timeout so long jobs are not taken as stale;
+    # if the lock is lost anyway, stop work the new owner is now doing.
+    while True:
+        await asyncio.sleep(settings.job_lock_timeout_seconds / 3)
+        if not await asyncio.to_thread(_heartbeat, job_id, worker_id):
+            logger.warning("%s lost the lock on job %s; cancelling", worker_id, job_id)
+            task.cancel()
+            return
+
+
+async def work(worker_id: str) -> None:
+    while True:
+        job = await asyncio.to_thread(_claim, worker_id)
+        if job is None:
+            await asyncio.sleep(settings.job_poll_interval_seconds)
+            continue
+
+        job_id = int(job.job_id)
+        logger.info("%s running job %s (%s)", worker_id, job_id, job.kind)
+        task = asyncio.create_task(_run(job))
+        lock = asyncio.create_task(_hold_lock(job_id, worker_id, task))
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if not lock.done():
+                raise
+            continue
+        except Exception as e:
+            logger.exception("job %s failed", job_id)
+            await asyncio.to_thread(_fail, job_id, worker_id, repr(e))
+        else:
+            await asyncio.to_thread(_complete, job_id, worker_id, result)
+        finally:
+            lock.cancel()
+
+
+async def main() -> None:
+    Base.metadata.create_all(bind=engine)
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    await asyncio.gather(
+        *(work(f"{prefix}:{i}") for i in range(settings.worker_concurrency))
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())